@@ -0,0 +1,49 @@
+"""
+run_ensemble.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Run several wavelengths and polarizations in one MPI job, e.g.:
+    mpirun -np 32 python run_ensemble.py
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import semp
+
+#Meep parameters
+MEEP_params = {
+    ### Mask Properties ###
+    'sim_geometry':     'edge',
+    'seam_dark':        10,
+    'seam_lite':        25,
+    'wafer_material':   'Si',
+    'skin_material':    'Ag',
+    'wafer_thick':      2.,
+    'skin_thick':       0.25,
+
+    ### Numerics ###
+    'resolution':       50,
+    'pml_all':          4,
+    'pad_all':          4,
+    'n_periods':        150,
+}
+
+#Main parameters
+PROP_params = {
+    'session':          'edge_ensemble',
+    'save_all':         False,
+}
+
+#Ensemble parameters (8 groups of 4 processes on 32 cores)
+ENS_params = {
+    'waves':            [0.641, 0.660, 0.699, 0.725],
+    'polars':           ['s', 'p'],
+    'n_groups':         8,
+}
+
+#Run ensemble
+ens = semp.ensemble.Ensemble(MEEP_params, PROP_params, ENS_params)
+ens.run()
@@ -32,6 +32,9 @@ n_periods = 150
 
 waves = [0.641, 0.660, 0.699, 0.725]
 
+#Run all wavelengths in single pulsed simulation
+is_broadband = False
+
 ######################################
 
 #Meep parameters
@@ -67,13 +70,25 @@ PROP_params = {
     'save_all':         False,
 }
 
-#Loop through wavelengths and run
-for wv in waves:
+if is_broadband:
 
-    #Add wavelength to parameters
-    MEEP_params['wave'] = wv
-    PROP_params['session'] = f'{base_dir}/{wv*1e3:.0f}nm'
+    #Add wavelengths to parameters (saved to 'base_dir/###nm')
+    MEEP_params['waves'] = waves
+    PROP_params['session'] = base_dir
 
     #Run simulation
     prop = semp.Propagator(MEEP_params, PROP_params)
     prop.run_sim()
+
+else:
+
+    #Loop through wavelengths and run
+    for wv in waves:
+
+        #Add wavelength to parameters
+        MEEP_params['wave'] = wv
+        PROP_params['session'] = f'{base_dir}/{wv*1e3:.0f}nm'
+
+        #Run simulation
+        prop = semp.Propagator(MEEP_params, PROP_params)
+        prop.run_sim()
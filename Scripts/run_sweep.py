@@ -0,0 +1,56 @@
+"""
+run_sweep.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Run sweep of SEMP simulations on local pool of MPI workers
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import semp
+
+#Meep parameters
+MEEP_params = {
+    ### Lab Properties  ###
+    'polars':           ['s', 'p'],
+
+    ### Mask Properties ###
+    'sim_geometry':     'edge',
+    'seam_dark':        10,
+    'seam_lite':        25,
+    'wafer_material':   'Si',
+    'skin_material':    'Ag',
+    'wafer_thick':      2.,
+    'skin_thick':       0.25,
+
+    ### Numerics ###
+    'resolution':       50,
+    'pml_all':          4,
+    'pad_all':          4,
+    'n_periods':        150,
+}
+
+#Main parameters
+PROP_params = {
+    'save_all':         False,
+}
+
+#Parameters to sweep over
+grid = {
+    'wave':             [0.641, 0.660, 0.699, 0.725],
+    'taper_angle':      [0, 5, 10],
+}
+
+#Sweep parameters
+SWEEP_params = {
+    'session':          'taper_sweep',
+    'n_procs':          4,
+    'max_retries':      1,
+}
+
+#Run sweep
+sweep = semp.sweep.Sweep(MEEP_params, PROP_params, grid, SWEEP_params)
+sweep.run()
@@ -0,0 +1,108 @@
+"""
+bench_analysis.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Benchmarks of Analyzer loading and processing synthetic HDF5 files
+    of realistic size, and of Sommerfeld's solution on large grids
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import semp
+import numpy as np
+import tempfile
+import pickle
+import shutil
+import h5py
+from benchmark import Benchmark
+
+def write_synthetic_run(data_dir, resolution, output_format='files'):
+    """Write files in the layout saved by Propagator (full cell, 2D edge)"""
+
+    #Parameters
+    meep_params = {'sim_geometry':'edge', 'resolution':resolution, 'wave':0.641}
+    prop_params = {'verbose':False, 'output_region':'full', 'output_format':output_format}
+    pickle.dump({'MEEP_params':meep_params, 'PROP_params':prop_params}, \
+        open(f'{data_dir}/parameters.pck', 'wb'))
+    pickle.dump(semp.utils.def_params, open(f'{data_dir}/def_params.pck', 'wb'))
+
+    #Coordinates of full cell
+    prop = semp.Propagator(meep_params, prop_params, is_analysis=True)
+    geo = prop.msim.geo
+    xx = np.linspace(-geo.lx/2, geo.lx/2, int(geo.lx*resolution) + 1)
+    yy = np.linspace(-geo.ly/2, geo.ly/2, int(geo.ly*resolution) + 1)
+    zz = np.array([0.])
+    pst = f'-{prop.msim.run_time:09.2f}'
+
+    #Random fields (plane wave in vacuum)
+    rng = np.random.default_rng(0)
+    for pre, shape in zip(['vac-', ''], [(xx.size,), (xx.size, yy.size)]):
+
+        #Single file (as written by Propagator)
+        if output_format == 'single':
+            prop.write_single(data_dir, f'{pre}eps', np.ones(shape), \
+                {'xx':xx, 'yy':yy, 'zz':zz, 'time':prop.msim.run_time})
+            for comp in ['ez', 'hy', 'hz', 'ey']:
+                prop.write_single(data_dir, f'{pre}{comp}', 1 + rng.random(shape) + \
+                    1j*rng.random(shape), {'time':prop.msim.run_time})
+            continue
+
+        #Coordinates
+        with h5py.File(f'{data_dir}/{pre}coords{pst}.h5', 'w') as f:
+            for c, v in zip(['xx', 'yy', 'zz'], [xx, yy, zz]):
+                f.create_dataset(c, data=v)
+
+        #Fields
+        for comp in ['ez', 'hy', 'hz', 'ey']:
+            with h5py.File(f'{data_dir}/{pre}{comp}{pst}.h5', 'w') as f:
+                f.create_dataset(f'{comp}.r', data=1 + rng.random(shape))
+                f.create_dataset(f'{comp}.i', data=rng.random(shape))
+
+class Time_Analyzer(Benchmark):
+
+    params = [[30, 100], ['files', 'single']]
+    param_names = ['resolution', 'output_format']
+
+    def setup(self, resolution, output_format):
+        #Write synthetic run
+        self.base_dir = tempfile.mkdtemp()
+        self.session = 'bench'
+        self.util = semp.utils.Utilities()
+        write_synthetic_run(self.util.create_directory( \
+            f'{self.base_dir}/{self.session}'), resolution, output_format=output_format)
+
+        #Load analyzer
+        self.alz = semp.analysis.Analyzer({'base_dir':self.base_dir, \
+            'session':self.session})
+        self.xind = self.alz.get_xind()
+
+    def teardown(self, resolution, output_format):
+        shutil.rmtree(self.base_dir)
+
+    def time_load_field(self, resolution, output_format):
+        self.alz.load_field('ez')
+
+    def time_load_field_slice(self, resolution, output_format):
+        self.alz.load_field('ez', ind=self.xind)
+
+    def time_get_data(self, resolution, output_format):
+        self.alz.get_data('ez')
+
+    def time_collect_braunbek(self, resolution, output_format):
+        self.alz.collect_braunbek()
+
+class Time_Sommerfeld(Benchmark):
+
+    params = [[int(1e4), int(1e6)]]
+    param_names = ['n_points']
+    repeat = 3
+
+    def setup(self, n_points):
+        self.som = semp.analysis.Sommerfeld({'wave':0.641})
+        self.yy = np.linspace(-20, 20, n_points)
+
+    def time_sommerfeld_solution(self, n_points):
+        self.som.get_sommerfeld_solution(3., self.yy, is_bbek=True)
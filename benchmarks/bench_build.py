@@ -0,0 +1,61 @@
+"""
+bench_build.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Benchmarks of building simulations and initializing structures
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import semp
+from benchmark import Benchmark
+
+def get_meep_params(geometry, is_scallop, resolution=20):
+    #Geometry (corner is 3D, so smaller)
+    params = {
+        'sim_geometry':     geometry,
+        'polars':           ['s'],
+        'wafer_material':   'Si',
+        'skin_material':    'Ag',
+        'wafer_thick':      2.,
+        'skin_thick':       0.25,
+        'seam_dark':        [5., 2.][int(geometry == 'corner')],
+        'seam_lite':        [5., 2.][int(geometry == 'corner')],
+        'gap_width':        [5., 2.][int(geometry == 'corner')],
+        'corner_length':    2.,
+        'resolution':       [resolution, resolution//2][int(geometry == 'corner')],
+        'pml_all':          1.,
+        'pad_all':          1.,
+        'n_periods':        10,
+    }
+
+    #Scallops
+    if is_scallop:
+        params.update({'scallop_depth':0.2, 'scallop_height':0.5})
+
+    return params
+
+def get_prop(meep_params):
+    #Propagator without saving
+    return semp.Propagator(meep_params, {'verbose':False}, is_analysis=True)
+
+class Time_Build(Benchmark):
+
+    params = [['edge', 'gap', 'corner'], [False, True]]
+    param_names = ['geometry', 'scallop']
+    repeat = 3
+
+    def setup(self, geometry, is_scallop):
+        self.prop = get_prop(get_meep_params(geometry, is_scallop))
+
+    def time_build_sim(self, geometry, is_scallop):
+        sim = self.prop.msim.build_sim(pol='s')
+        sim.reset_meep()
+
+    def time_init_structure(self, geometry, is_scallop):
+        sim = self.prop.msim.build_sim(pol='s')
+        sim.init_sim()
+        sim.reset_meep()
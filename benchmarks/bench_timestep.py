@@ -0,0 +1,47 @@
+"""
+bench_timestep.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Benchmarks of time stepping rate at several resolutions
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import numpy as np
+from benchmark import Benchmark
+from bench_build import get_meep_params, get_prop
+
+class Time_Step(Benchmark):
+
+    params = [[20, 40, 80], ['metal', 'dispersive']]
+    param_names = ['resolution', 'materials']
+    repeat = 3
+    n_steps = 50
+
+    def setup(self, resolution, materials):
+        #Edge simulation (Si + Ag has Lorentzian poles)
+        meep_params = get_meep_params('edge', False, resolution=resolution)
+        if materials == 'metal':
+            meep_params.update({'wafer_material':'metal', 'skin_material':'metal'})
+
+        #Initialize
+        self.prop = get_prop(meep_params)
+        self.sim = self.prop.msim.build_sim(pol='s')
+        self.sim.init_sim()
+
+        #Time of n_steps
+        self.dt = self.prop.msim.courant / resolution
+        self.n_points = np.prod([l*resolution for l in \
+            [self.prop.msim.geo.lx, self.prop.msim.geo.ly] if l > 0])
+
+    def teardown(self, resolution, materials):
+        self.sim.reset_meep()
+
+    def time_steps(self, resolution, materials):
+        self.sim.run(until=self.n_steps*self.dt)
+
+        #Rates reported per second
+        return {'steps_per_sec':self.n_steps, 'point_steps_per_sec':self.n_steps*self.n_points}
@@ -0,0 +1,148 @@
+"""
+benchmark.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Harness to time benchmark cases (asv-style 'time_*' methods) and
+    save results to JSON for comparison before and after performance changes
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import semp
+import numpy as np
+import itertools
+import platform
+import datetime
+import subprocess
+import time
+import json
+import os
+
+class Benchmark(object):
+    """Base class of benchmark cases. Each 'time_*' method is timed for every
+       combination of 'params', after calling setup(*param) once."""
+
+    params = []
+    param_names = []
+    repeat = 5
+    number = 1
+
+    def setup(self, *param):
+        pass
+
+    def teardown(self, *param):
+        pass
+
+############################################
+####	Run Benchmarks ####
+############################################
+
+def get_cases(bench_classes, filt=None):
+    #All (class, method, parameter) combinations
+    cases = []
+    for cls in bench_classes:
+        params = list(itertools.product(*cls.params)) if len(cls.params) > 0 else [()]
+        for meth in sorted([m for m in dir(cls) if m.startswith('time_')]):
+            for param in params:
+                name = get_case_name(cls, meth, param)
+                if filt is None or filt in name:
+                    cases.append((cls, meth, param, name))
+    return cases
+
+def get_case_name(cls, meth, param):
+    pstr = ''.join([f'[{p}]' for p in param])
+    return f'{cls.__name__}.{meth}{pstr}'
+
+def run_case(cls, meth, param):
+    #Setup
+    bench = cls()
+    bench.setup(*param)
+
+    #Warm up (and collect extra metrics returned by method)
+    extra = getattr(bench, meth)(*param)
+
+    #Time repeats
+    times = []
+    for i in range(bench.repeat):
+        tik = time.perf_counter()
+        for j in range(bench.number):
+            getattr(bench, meth)(*param)
+        times.append((time.perf_counter() - tik) / bench.number)
+
+    #Teardown
+    bench.teardown(*param)
+
+    #Results
+    res = {'median':float(np.median(times)), 'min':float(np.min(times)), \
+        'std':float(np.std(times)), 'repeat':bench.repeat, \
+        'params':dict(zip(cls.param_names, [str(p) for p in param]))}
+
+    #Metrics per unit of work (e.g. steps per second)
+    if isinstance(extra, dict):
+        res.update({k: float(v / res['median']) for k, v in extra.items()})
+
+    return res
+
+def run_benchmarks(bench_classes, filt=None, out_file=None):
+    #Gather cases
+    cases = get_cases(bench_classes, filt=filt)
+
+    #Run each
+    results = {}
+    for cls, meth, param, name in cases:
+        results[name] = run_case(cls, meth, param)
+        print(f'{name:<60s} {results[name]["median"]:10.4g} [s]')
+
+    #Package with machine info
+    out = {'info':get_machine_info(), 'results':results}
+
+    #Save
+    if out_file is not None:
+        with open(out_file, 'w') as f:
+            json.dump(out, f, indent=2)
+        print(f'\nSaved: {out_file}\n')
+
+    return out
+
+def get_machine_info():
+    #Git revision of SEMP
+    try:
+        rev = subprocess.run(['git', '-C', semp.pkg_home_dir, 'rev-parse', '--short', \
+            'HEAD'], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        rev = ''
+
+    return {'machine':platform.node(), 'processor':platform.processor(), \
+        'python':platform.python_version(), 'n_cpu':os.cpu_count(), \
+        'mpi_size':semp.mpi_size, 'semp_rev':rev, \
+        'date':str(datetime.datetime.now())}
+
+############################################
+############################################
+
+############################################
+####	Compare ####
+############################################
+
+def compare_results(old_file, new_file, threshold=1.1):
+    #Load
+    old = json.load(open(old_file, 'r'))['results']
+    new = json.load(open(new_file, 'r'))['results']
+
+    #Print ratios of shared cases
+    print(f'\n{"Case":<60s} {"Old [s]":>10s} {"New [s]":>10s} {"Ratio":>7s}')
+    ratios = {}
+    for name in [k for k in old.keys() if k in new.keys()]:
+        ratios[name] = new[name]['median'] / old[name]['median']
+        flag = ['', ' (slower)', ' (faster)'][int(ratios[name] > threshold) + \
+            2*int(ratios[name] < 1/threshold)]
+        print(f'{name:<60s} {old[name]["median"]:10.4g} {new[name]["median"]:10.4g} ' + \
+            f'{ratios[name]:7.2f}{flag}')
+
+    return ratios
+
+############################################
+############################################
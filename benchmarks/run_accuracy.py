@@ -0,0 +1,186 @@
+"""
+run_accuracy.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Accuracy versus cost of numerical settings, measured against
+    Sommerfeld's analytic solution, e.g.:
+    mpirun -np 4 python run_accuracy.py --tol 0.01 --out accuracy.json
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import semp
+import numpy as np
+import itertools
+import argparse
+import shutil
+import time
+import json
+import benchmark
+
+#Numerical settings to sweep
+def_grid = {
+    'resolution':       [20, 30, 40, 60],
+    'pml_all':          [2., 4.],
+    'pad_all':          [2., 4.],
+    'use_absorber':     [True, False],
+    'courant':          [0.5, 0.25],
+    'n_periods':        [30, 50, 80],
+}
+
+#Small sweep for quick checks
+quick_grid = {
+    'resolution':       [20, 30],
+    'pml_all':          [4.],
+    'pad_all':          [4.],
+    'use_absorber':     [True],
+    'courant':          [0.5],
+    'n_periods':        [30, 50],
+}
+
+class Accuracy_Benchmark(object):
+
+    ### HARDWIRED ###
+    wave = 0.641
+    seam_dark = 5.
+    seam_lite = 10.
+    obs_distances = [0, 3]
+    data_names = ['ez', 'hz', 'ey', 'hy']
+
+    def __init__(self, grid=def_grid):
+        self.grid = grid
+        self.base_dir = f'{semp.tmp_dir}/accuracy'
+
+############################################
+####	Main Script ####
+############################################
+
+    def run(self):
+        #All combinations of settings
+        names = list(self.grid.keys())
+        combos = list(itertools.product(*[self.grid[k] for k in names]))
+
+        #Loop through and run each
+        self.points = []
+        for i, combo in enumerate(combos):
+            settings = dict(zip(names, combo))
+            wall_time, error = self.run_point(settings)
+            self.points.append({'settings':settings, 'wall_time':wall_time, 'error':error})
+
+            #Print
+            if semp.zero_rank:
+                print(f'*** [{i+1}/{len(combos)}] {settings}: {wall_time:.1f} [s], ' + \
+                    f'error = {error:.2e} ***')
+
+        #Find Pareto front
+        self.front = get_pareto_front(self.points)
+
+        return self.points, self.front
+
+    def run_point(self, settings):
+        #Parameters
+        MEEP_params = {
+            'polars':           ['s', 'p'],
+            'wave':             self.wave,
+            'sim_geometry':     'edge',
+            'is_sommerfeld':    True,
+            'seam_dark':        self.seam_dark,
+            'seam_lite':        self.seam_lite,
+        }
+        MEEP_params.update(settings)
+
+        PROP_params = {
+            'verbose':          False,
+            'base_dir':         self.base_dir,
+            'session':          'point',
+            'save_all':         False,
+            'use_vac_cache':    False,      # Time full run, including vacuum
+        }
+
+        #Run and time simulation
+        semp.mpi_barrier()
+        tik = time.perf_counter()
+        prop = semp.Propagator(MEEP_params, PROP_params)
+        prop.run_sim()
+        semp.mpi_barrier()
+        wall_time = time.perf_counter() - tik
+
+        #Error of Braunbek fields (worst over fields and observation distances)
+        error = max([self.get_error(obs) for obs in self.obs_distances])
+
+        #Cleanup
+        semp.mpi_barrier()
+        if semp.zero_rank:
+            shutil.rmtree(prop.logger.data_dir)
+
+        return wall_time, error
+
+    def get_error(self, obs_distance):
+        #Load normalized Braunbek fields
+        alz = semp.analysis.Analyzer({'base_dir':self.base_dir, 'session':'point', \
+            'obs_distance':obs_distance})
+        xind = alz.get_xind()
+        sdata = [alz.get_data(dn, ind=xind, is_bbek=True) for dn in self.data_names]
+
+        #Sommerfeld solution
+        som = semp.analysis.Sommerfeld({'wave':self.wave})
+        aex, aey, aez, ahx, ahy, ahz = som.get_sommerfeld_solution(alz.xx[xind], \
+            alz.yy, is_bbek=True)
+
+        #Mean difference (as in test_sommerfeld)
+        return max([np.abs(sd - ad).mean() for sd, ad in zip(sdata, [aez, ahz, aey, ahy])])
+
+############################################
+############################################
+
+############################################
+####	Pareto Front ####
+############################################
+
+def get_pareto_front(points):
+    #Sort by cost, keep points more accurate than all cheaper points
+    front = []
+    for pt in sorted(points, key=lambda p: (p['wall_time'], p['error'])):
+        if len(front) == 0 or pt['error'] < front[-1]['error']:
+            front.append(pt)
+    return front
+
+def get_cheapest(front, tol):
+    #Cheapest settings meeting accuracy
+    good = [pt for pt in front if pt['error'] <= tol]
+    return good[0] if len(good) > 0 else None
+
+############################################
+############################################
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='SEMP accuracy vs cost')
+    parser.add_argument('--quick', action='store_true', help='Run small sweep')
+    parser.add_argument('--tol', type=float, default=0.01, help='Required Braunbek accuracy')
+    parser.add_argument('--out', default=None, help='JSON file to save points and front')
+    opts = parser.parse_args()
+
+    #Run
+    bench = Accuracy_Benchmark(grid=[def_grid, quick_grid][int(opts.quick)])
+    points, front = bench.run()
+
+    if semp.zero_rank:
+
+        #Print front
+        print('\n*** Pareto Front ***')
+        for pt in front:
+            print(f'{pt["wall_time"]:8.1f} [s] {pt["error"]:.2e} {pt["settings"]}')
+
+        #Cheapest meeting tolerance
+        best = get_cheapest(front, opts.tol)
+        best_str = best['settings'] if best is not None else 'None meet tolerance'
+        print(f'\n*** Cheapest with error < {opts.tol}: {best_str} ***\n')
+
+        #Save
+        if opts.out is not None:
+            json.dump({'info':benchmark.get_machine_info(), 'tol':opts.tol, \
+                'points':points, 'front':front, 'best':best}, open(opts.out, 'w'), indent=2)
@@ -0,0 +1,57 @@
+"""
+run_benchmarks.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Run SEMP benchmark suite and save results to JSON, e.g.:
+    python run_benchmarks.py --filter Time_Step --out before.json
+    python run_benchmarks.py --compare before.json after.json
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import semp
+import argparse
+import datetime
+import os
+import benchmark
+from bench_build import Time_Build
+from bench_timestep import Time_Step
+from bench_analysis import Time_Analyzer, Time_Sommerfeld
+
+#All benchmark cases
+bench_classes = [Time_Build, Time_Step, Time_Analyzer, Time_Sommerfeld]
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='SEMP benchmarks')
+    parser.add_argument('--filter', default=None, help='Only run cases containing string')
+    parser.add_argument('--out', default=None, help='JSON file to save results')
+    parser.add_argument('--compare', nargs=2, default=None, help='Compare two result files')
+    parser.add_argument('--calibrate', action='store_true', \
+        help='Save measured step rate to calibration file of semp.estimate')
+    opts = parser.parse_args()
+
+    #Compare previous results
+    if opts.compare is not None:
+        benchmark.compare_results(*opts.compare)
+
+    else:
+        #Default output file
+        if opts.out is None:
+            out_dir = semp.utils.util.create_directory( \
+                f'{os.path.dirname(os.path.abspath(__file__))}/results')
+            opts.out = f'{out_dir}/{datetime.datetime.now():%Y%m%d_%H%M%S}.json'
+
+        #Run
+        out = benchmark.run_benchmarks(bench_classes, filt=opts.filter, out_file=opts.out)
+
+        #Calibrate estimator with finest resolution step rate (non-dispersive)
+        if opts.calibrate:
+            rates = [v['point_steps_per_sec'] for k, v in out['results'].items() \
+                if k.startswith('Time_Step') and k.endswith('[metal]')]
+            if len(rates) > 0:
+                semp.estimator.save_calibration({'machine':out['info']['machine'], \
+                    'time_per_point_step':1./rates[-1]})
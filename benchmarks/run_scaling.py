@@ -0,0 +1,166 @@
+"""
+run_scaling.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: MPI strong and weak scaling of a short SEMP run, comparing chunk
+    layouts (SEMP default, meep's default split_chunks_evenly, SEMP cost-balanced), e.g.:
+    python run_scaling.py --max_np 16 --out scaling.json
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import semp
+import numpy as np
+import meep as mp
+import argparse
+import subprocess
+import tempfile
+import shutil
+import time
+import json
+import sys
+import os
+import benchmark
+from bench_build import get_meep_params
+
+############################################
+####	Worker (runs under mpirun) ####
+############################################
+
+#Chunk layouts to compare
+layouts = {
+    'semp':     {'split_chunks_evenly':False, 'chunk_layout':None},   # SEMP default
+    'even':     {'split_chunks_evenly':True,  'chunk_layout':None},   # Meep default
+    'cost':     {'split_chunks_evenly':False, 'chunk_layout':'cost'}, # SEMP cost-balanced
+}
+
+def run_worker(resolution, layout, n_steps, out_file):
+
+    #Edge simulation
+    meep_params = get_meep_params('edge', False, resolution=resolution)
+    meep_params.update(layouts[layout])
+    data_dir = tempfile.mkdtemp() if semp.zero_rank else None
+    prop = semp.Propagator(meep_params, {'verbose':False, \
+        'base_dir':semp.mpi_bcast(data_dir), 'session':''}, is_analysis=True)
+
+    #Initialize structure
+    tik = time.perf_counter()
+    sim = prop.msim.build_sim(pol='s')
+    sim.init_sim()
+    semp.mpi_barrier()
+    init_time = time.perf_counter() - tik
+
+    #Time steps (after one warm up step)
+    dt = prop.msim.courant / resolution
+    sim.run(until=dt)
+    semp.mpi_barrier()
+    tik = time.perf_counter()
+    sim.run(until=n_steps*dt)
+    semp.mpi_barrier()
+    step_time = time.perf_counter() - tik
+
+    #Output fields of full cell (gathered to rank 0)
+    tik = time.perf_counter()
+    vols = [mp.Volume(center=mp.Vector3(), size=sim.cell_size)]
+    prop.save_fields(sim, prop.get_field_names('s'), False, prop.logger.data_dir, vols)
+    semp.mpi_barrier()
+    output_time = time.perf_counter() - tik
+
+    #Save
+    if semp.zero_rank:
+        n_points = np.prod([l*resolution for l in [prop.msim.geo.lx, prop.msim.geo.ly]])
+        res = {'nprocs':semp.mpi_size, 'resolution':resolution, 'layout':layout, \
+            'n_points':float(n_points), 'init_time':init_time, \
+            'steps_per_sec':n_steps/step_time, 'output_time':output_time}
+        json.dump(res, open(out_file, 'w'))
+        shutil.rmtree(data_dir)
+
+    sim.reset_meep()
+
+############################################
+############################################
+
+############################################
+####	Driver ####
+############################################
+
+def run_case(nprocs, resolution, layout, opts):
+    #Launch worker with nprocs ranks
+    fd, out_file = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    cmd = [opts.mpirun, '-np', str(nprocs), sys.executable, os.path.abspath(__file__), \
+        '--worker', '--resolution', str(resolution), '--layout', layout, \
+        '--n_steps', str(opts.n_steps), '--out', out_file]
+    subprocess.run(cmd, check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+    #Load result
+    res = json.load(open(out_file, 'r'))
+    os.remove(out_file)
+
+    return res
+
+def run_scaling(opts):
+    #Rank counts (1, 2, 4, ... max_np)
+    nprocs = [2**i for i in range(int(np.log2(opts.max_np)) + 1)]
+
+    rows = []
+    for mode in ['strong', 'weak']:
+        for layout in layouts.keys():
+            base = None
+            for nn in nprocs:
+
+                #Weak scaling keeps points per rank fixed (2D)
+                res = opts.resolution * [1, np.sqrt(nn)][int(mode == 'weak')]
+                row = run_case(nn, int(round(res)), layout, opts)
+                row['mode'] = mode
+
+                #Efficiency relative to single rank
+                if base is None:
+                    base = row
+                if mode == 'strong':
+                    row['efficiency'] = row['steps_per_sec'] / (nn * base['steps_per_sec'])
+                else:
+                    row['efficiency'] = (row['steps_per_sec'] * row['n_points']) / \
+                        (nn * base['steps_per_sec'] * base['n_points'])
+
+                rows.append(row)
+                print_row(row)
+
+    return rows
+
+def print_row(row):
+    print(f'{row["mode"]:>6s} {row["layout"]:>8s} {row["nprocs"]:4d} ' + \
+        f'{row["resolution"]:5d} {row["steps_per_sec"]:10.2f} {row["efficiency"]:6.2f} ' + \
+        f'{row["init_time"]:8.2f} {row["output_time"]:8.2f}')
+
+############################################
+############################################
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='SEMP MPI scaling')
+    parser.add_argument('--max_np', type=int, default=os.cpu_count(), help='Largest rank count')
+    parser.add_argument('--resolution', type=int, default=40, help='Resolution of 1 rank')
+    parser.add_argument('--n_steps', type=int, default=100, help='Timesteps per case')
+    parser.add_argument('--mpirun', default='mpirun', help='MPI launcher')
+    parser.add_argument('--out', default=None, help='JSON file to save table')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--layout', default='semp', help=argparse.SUPPRESS)
+    opts = parser.parse_args()
+
+    #Single case under mpirun
+    if opts.worker:
+        run_worker(opts.resolution, opts.layout, opts.n_steps, opts.out)
+
+    #All cases
+    else:
+        print(f'{"mode":>6s} {"layout":>8s} {"np":>4s} {"res":>5s} {"steps/s":>10s} ' + \
+            f'{"eff":>6s} {"init[s]":>8s} {"out[s]":>8s}')
+        rows = run_scaling(opts)
+
+        if opts.out is not None:
+            json.dump({'info':benchmark.get_machine_info(), 'rows':rows}, \
+                open(opts.out, 'w'), indent=2)
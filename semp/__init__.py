@@ -22,14 +22,50 @@ try:
     mpi_rank = MPI.COMM_WORLD.rank      # processor ID number, from 0 up to size
     mpi_size = MPI.COMM_WORLD.size      # total number of processors running
     mpi_barrier = MPI.COMM_WORLD.Barrier
+    mpi_bcast = lambda x: MPI.COMM_WORLD.bcast(x, root=0)
+    mpi_gather = lambda x: MPI.COMM_WORLD.gather(x, root=0)
     has_mpi = True
 except ImportError:
     mpi_rank = 0
     mpi_size = 1
     mpi_barrier = lambda : None
+    mpi_bcast = lambda x: x
+    mpi_gather = lambda x: [x]
     has_mpi = False
 zero_rank = mpi_rank == 0
 
+#Group of processes (whole world unless split into ensemble)
+group_index = 0
+n_groups = 1
+group_rank = mpi_rank
+group_size = mpi_size
+group_barrier = mpi_barrier
+group_bcast = mpi_bcast
+group_gather = mpi_gather
+group_zero_rank = zero_rank
+
+def divide_groups(num_groups):
+    """Split processes into groups that each run a separate meep simulation"""
+    global group_index, n_groups, group_rank, group_size, group_barrier, \
+        group_bcast, group_gather, group_zero_rank
+
+    #Split meep's communicator
+    import meep as mp
+    group_index = mp.divide_parallel_processes(num_groups)
+    n_groups = num_groups
+
+    #Matching communicator for our own barriers and broadcasts
+    if has_mpi:
+        comm = MPI.COMM_WORLD.Split(color=group_index, key=mpi_rank)
+        group_rank = comm.rank
+        group_size = comm.size
+        group_barrier = comm.Barrier
+        group_bcast = lambda x: comm.bcast(x, root=0)
+        group_gather = lambda x: comm.gather(x, root=0)
+    group_zero_rank = group_rank == 0
+
+    return group_index
+
 #####################
 #####   Directories #####
 #####################
@@ -47,6 +83,10 @@ results_dir = rf"{os.getenv('HOME')}/Research/Optics_Modeling/Semp_Results"
 ext_data_dir = f"{pkg_home_dir}/External_Data"
 int_data_dir = f"{pkg_home_dir}/Internal_Data"
 tmp_dir = f"{int_data_dir}/tmp"
+vac_cache_dir = f"{int_data_dir}/vac_cache"
+structure_cache_dir = f"{int_data_dir}/structure_cache"
+calibration_file = f"{int_data_dir}/calibration.json"
+catalog_file = f"{results_dir}/catalog.db"
 
 #####################
 #####   Modules #####
@@ -54,5 +94,9 @@ tmp_dir = f"{int_data_dir}/tmp"
 
 import semp.utils
 from .propagator import Propagator
+from .estimator import estimate
 import semp.simulation
 import semp.analysis
+import semp.sweep
+import semp.job_queue
+import semp.ensemble
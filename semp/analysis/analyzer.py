@@ -16,6 +16,8 @@ import numpy as np
 import matplotlib.pyplot as plt;plt.ion()
 import h5py
 import glob
+import pickle
+import os
 
 class Analyzer(object):
 
@@ -53,6 +55,10 @@ class Analyzer(object):
             #Create PROP instance
             self.prop = semp.Propagator(prop_params, is_analysis=True)
 
+        #Use vacuum normalization from run
+        if self.analytic_vac is None:
+            self.analytic_vac = self.prop.analytic_vac
+
         #Shift observation point to align with wafer bottom
         self.obs_distance += self.prop.msim.wafer_thick/2
 
@@ -89,7 +95,10 @@ class Analyzer(object):
     def get_data(self, comp, ind=None, is_bbek=False):
         #Load data
         fld = self.load_field(comp, ind=ind)
-        vac = self.load_field(comp, ind=ind, is_vac=True)
+        vac = self.get_vac_field(comp, ind=ind)
+
+        #Shift phase to time of vacuum field (runs may stop at different times)
+        fld *= self.get_phase_correction(comp)
 
         #Normalize by vacuum field
         if not np.allclose(np.abs(vac),0):
@@ -101,6 +110,45 @@ class Analyzer(object):
 
         return fld
 
+    def get_phase_correction(self, comp):
+
+        #Phasors (DFT) don't depend on end time; analytic vacuum uses field's time
+        if self.analytic_vac or self.prop.msim.dft_periods is not None or \
+            self.prop.msim.is_broadband:
+            return 1.
+
+        #Times fields were written
+        comp = comp.lower()
+        ext = self.get_region_ext()
+        fld_time = self.get_field_time(self.data_dir, f'{comp}{ext}')
+        vac_time = self.get_field_time(self.vac_dirs[self.get_comp_pol(comp)], \
+            f'vac-{comp}{ext}')
+
+        #Fields vary as exp(-i*w*t)
+        return np.exp(1j*2.*np.pi*self.prop.msim.fcen*(fld_time - vac_time))
+
+    def get_vac_field(self, comp, ind=None):
+
+        #Load simulated vacuum
+        if not self.analytic_vac:
+            return self.load_field(comp, ind=ind, is_vac=True)
+
+        #Fix ind
+        if ind is None:
+            ind = slice(None)
+
+        #Time of field output
+        run_time = self.get_field_time(self.data_dir, comp.lower() + self.get_region_ext())
+
+        #Calculate at observation points
+        vac = self.prop.msim.get_analytic_vacuum(comp, self.xx[ind], run_time)
+
+        #Add shape to vacuum to divide by fld
+        if len(vac.shape) != 0:
+            vac = vac[:,None]
+
+        return vac
+
 ############################################
 ############################################
 
@@ -110,36 +158,88 @@ class Analyzer(object):
 
     def load_metadata(self):
 
-        #Get time extension for filenames
-        if self.time_ext is None:
-            time_ext = float(np.load(f'{self.data_dir}/time_ext.npy'))
-            self.meta_time_ext = f"-{time_ext:09.2f}"
-            self.data_time_ext = glob.glob(f'{self.data_dir}/ez-*.h5')[0] \
-                .split('/')[-1].split('ez')[-1].split('.h5')[0]
-        else:
-            self.meta_time_ext = '-' + self.time_ext
-            self.data_time_ext = '-' + self.time_ext
+        #Get directories holding vacuum fields
+        self.load_vac_dirs()
 
-        #Load coordinates
-        for is_vac in [True, False]:
+        #Load coordinates (no vacuum run if analytic)
+        for is_vac in [[True, False], [False]][int(self.analytic_vac)]:
 
             #Prefix
             pre = ['','vac-'][int(is_vac)]
 
-            with h5py.File(f"{self.data_dir}/{pre}coords{self.meta_time_ext}.h5", 'r') as f:
-                for c in ['xx','yy','zz']:
-                    setattr(self, f"{['','vac_'][int(is_vac)]}{c}", f[c][()])
+            #Directory
+            load_dir = [self.data_dir, self.vac_dirs[self.prop.msim.polars[0]]][int(is_vac)]
 
-        #Trim PML
-        self.trim_pml()
+            for c, v in zip(['xx','yy','zz'], self.read_coords(load_dir, pre, \
+                ext=self.get_region_ext())):
+                setattr(self, f"{['','vac_'][int(is_vac)]}{c}", v)
+
+        #Trim PML (unless only output region was saved)
+        self.trim_pml(is_trimmed=self.prop.output_type != 'full')
+
+    def get_filename(self, load_dir, name):
+
+        #Use specified time extension
+        if self.time_ext is not None:
+            return f'{load_dir}/{name}-{self.time_ext}.h5'
+
+        #Find file (run times may differ between runs, so take latest)
+        return sorted(glob.glob(f'{load_dir}/{name}-*.h5'))[-1]
+
+    def get_file_time(self, fname):
+        #Simulation time at which file was written
+        return float(fname.split('-')[-1].split('.h5')[0])
+
+    def get_single_file(self, load_dir):
+        #File holding all outputs of directory (None if saved in separate files)
+        fname = f'{load_dir}/{self.prop.single_file}'
+        if os.path.exists(fname):
+            return fname
+        return None
+
+    def get_region_ext(self):
+        #Explicit volumes are loaded one at a time (others with load_region)
+        if self.prop.output_type == 'volumes':
+            return f'_vol{self.output_volume}'
+        return ''
+
+    def get_field_time(self, load_dir, name):
+        #Stored with dataset in single file
+        single = self.get_single_file(load_dir)
+        if single is not None:
+            with h5py.File(single, 'r') as f:
+                return float(f[name].attrs['time'])
+
+        return self.get_file_time(self.get_filename(load_dir, name))
+
+    def load_vac_dirs(self):
+
+        #Pointers to vacuum cache
+        fname = f'{self.data_dir}/vac_dirs.pck'
+
+        #Load if exists, otherwise vacuum is stored in data directory
+        if os.path.exists(fname):
+            self.vac_dirs = pickle.load(open(fname, 'rb'))
+        else:
+            self.vac_dirs = {'s':self.data_dir, 'p':self.data_dir}
+
+    def get_comp_pol(self, comp):
+        #Polarization that component was run with
+        return ['p', 's'][int(comp.lower() in ['ez', 'hx', 'hy'])]
 
-    def trim_pml(self):
+    def trim_pml(self, is_trimmed=False):
 
         #Store pml size (with pad for y)
         self.pnum_x = int(self.prop.msim.geo.pmlx * self.prop.msim.resolution)
         self.pnum_y = int(self.prop.msim.geo.padpmly * self.prop.msim.resolution)
         self.pnum_z = int(self.prop.msim.geo.pmlz * self.prop.msim.resolution)
 
+        #Data saved without pml, only need to shift y
+        if is_trimmed:
+            self.pnum_x, self.pnum_y, self.pnum_z = 0, 0, 0
+            self.yy += self.prop.msim.geo.edge_y
+            return
+
         #Exit if this has been done before
         if abs(self.yy.size - self.prop.msim.geo.ly * self.prop.msim.resolution) > 5:
             print('\nPML Already Trimmed!\n')
@@ -166,22 +266,15 @@ class Analyzer(object):
         #Vacuuum extension
         vac_ext = ['', 'vac-'][int(is_vac)]
 
-        #Filename
-        fname = self.data_dir + '/' + vac_ext + comp + self.data_time_ext + ".h5"
+        #Directory (vacuum may be in cache)
+        load_dir = [self.data_dir, self.vac_dirs[self.get_comp_pol(comp)]][int(is_vac)]
 
-        #Load data (without pml) - ugly index is due to slow fancy indexing in h5py
-        with h5py.File(fname, 'r') as f:
-            if not is_vac:
-                sx, sy = f[f'{comp}.r'].shape
-                data = f[f'{comp}.r'][self.pnum_x:sx-self.pnum_x, self.pnum_y:sy-self.pnum_y] + \
-                    1j*f[f'{comp}.i'][self.pnum_x:sx-self.pnum_x, self.pnum_y:sy-self.pnum_y]
-            else:
-                sx = f[f'{comp}.r'].shape[0]
-                data = f[f'{comp}.r'][self.pnum_x:sx-self.pnum_x] + \
-                    1j*f[f'{comp}.i'][self.pnum_x:sx-self.pnum_x]
+        #PML to trim (y only in non-vacuum)
+        trim = [[self.pnum_x, self.pnum_y], [self.pnum_x]][int(is_vac)]
 
-        #Extract index slice
-        data = data[ind]
+        #Load data (without pml)
+        data = self.read_field(load_dir, vac_ext + comp + self.get_region_ext(), comp, \
+            trim=trim, ind=ind)
 
         #Add shape to vacuum to divide by fld
         if is_vac and len(data.shape) != 0:
@@ -189,6 +282,74 @@ class Analyzer(object):
 
         return data
 
+    def load_region(self, comp, ivol, is_vac=False):
+
+        #lowercase
+        comp = comp.lower()
+
+        #Vacuuum extension
+        vac_ext = ['', 'vac-'][int(is_vac)]
+
+        #Directory (vacuum may be in cache)
+        load_dir = [self.data_dir, self.vac_dirs[self.get_comp_pol(comp)]][int(is_vac)]
+
+        #Load data
+        data = self.read_field(load_dir, f'{vac_ext}{comp}_vol{ivol}', comp)
+
+        #Load coordinates
+        xx, yy, zz = self.read_coords(load_dir, vac_ext, ext=f'_vol{ivol}')
+
+        return data, xx, yy, zz
+
+    def read_field(self, load_dir, name, comp, trim=[], ind=slice(None)):
+
+        #Single file (native complex) or separate file (real and imaginary parts)
+        single = self.get_single_file(load_dir)
+        if single is not None:
+            fname = single
+        else:
+            fname = self.get_filename(load_dir, name)
+
+        with h5py.File(fname, 'r') as f:
+
+            #Shape of stored field
+            if single is not None:
+                shape = f[name].shape
+            else:
+                shape = f[f'{comp}.r'].shape
+
+            #Trim ends of leading axes - ugly index is due to slow fancy indexing in h5py
+            slc = [slice(t, sz - t) for sz, t in zip(shape, trim)]
+
+            #Only read requested row (single chunk in single file)
+            is_row = isinstance(ind, (int, np.integer)) and ind >= 0 and len(slc) > 0
+            if is_row:
+                slc[0] = trim[0] + ind
+
+            #Load data
+            if single is not None:
+                data = f[name][tuple(slc)]
+            else:
+                data = f[f'{comp}.r'][tuple(slc)] + 1j*f[f'{comp}.i'][tuple(slc)]
+
+        #Extract index slice (vacuum at single point has no axes)
+        if not is_row and np.ndim(data) > 0:
+            data = data[ind]
+
+        return data
+
+    def read_coords(self, load_dir, pre, ext=''):
+
+        #Attributes of dielectric in single file
+        single = self.get_single_file(load_dir)
+        if single is not None:
+            with h5py.File(single, 'r') as f:
+                return [f[f'{pre}eps{ext}'].attrs[c] for c in ['xx', 'yy', 'zz']]
+
+        #Separate coordinates file
+        with h5py.File(self.get_filename(load_dir, f'{pre}coords{ext}'), 'r') as f:
+            return [f[c][()] for c in ['xx', 'yy', 'zz']]
+
 ############################################
 ############################################
 
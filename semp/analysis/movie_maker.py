@@ -31,10 +31,10 @@ class Movie_Maker(object):
             return
 
         #Wait for processors to catch up
-        semp.MPI.COMM_WORLD.Barrier()
+        semp.group_barrier()
 
         #Return if not zero rank
-        if not (self.parent.do_save and semp.zero_rank):
+        if not (self.parent.do_save and semp.group_zero_rank):
             return
 
         #Create movie
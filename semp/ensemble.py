@@ -0,0 +1,189 @@
+"""
+ensemble.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Class to run several wavelengths and polarizations at once by
+    splitting the processes of one MPI job into groups
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import semp
+import numpy as np
+import pickle
+import h5py
+import glob
+import sys
+import os
+
+class Ensemble(object):
+
+    def __init__(self, meep_params, prop_params, params={}):
+        self.util = semp.utils.Utilities()
+        #Initialize
+        self.initialize(meep_params, prop_params, params)
+
+############################################
+####	Initialization ####
+############################################
+
+    def initialize(self, meep_params, prop_params, params):
+        #Set ensemble parameters
+        self.util.set_default_params(self, params, semp.utils.def_params_ENSEMBLE)
+
+        #Base parameters
+        self.meep_params = self.util.deepcopy(meep_params)
+        self.prop_params = self.util.deepcopy(prop_params)
+
+        #Fill in wavelengths and polarizations from base parameters
+        def_meep = semp.utils.def_params['MEEP_params']
+        if self.waves is None:
+            self.waves = [self.meep_params.get('wave', def_meep['wave'])]
+        if self.polars is None:
+            self.polars = self.meep_params.get('polars', def_meep['polars'])
+        self.waves = np.atleast_1d(self.waves).tolist()
+
+        #Output directory of ensemble
+        def_prop = semp.utils.def_params['PROP_params']
+        self.base_dir = self.prop_params.get('base_dir', def_prop['base_dir'])
+        self.session = self.prop_params.get('session', def_prop['session'])
+        self.data_dir = f'{self.base_dir}/{self.session}'
+
+        #Build list of runs
+        self.build_tasks()
+
+        #Number of groups (no more than one per process)
+        if self.n_groups is None:
+            self.n_groups = min(len(self.tasks), semp.mpi_size)
+
+        if self.n_groups > semp.mpi_size:
+            bad_str = self.util.color_string('!*!', self.util.bad_color)
+            print(f'\n{bad_str} More Groups ({self.n_groups}) than Processes ' + \
+                f'({semp.mpi_size}) {bad_str}\n')
+            sys.exit(0)
+
+        #Assign runs to groups (round robin)
+        for i, task in enumerate(self.tasks):
+            task['group'] = i % self.n_groups
+
+    def build_tasks(self):
+        #Each wavelength and polarization saved to own session (merged after run)
+        self.tasks = []
+        for wave in self.waves:
+            for pol in self.polars:
+                name = f'{wave*1e3:.0f}nm_{pol}'
+                self.tasks.append({'name':name, 'wave':wave, 'pol':pol, \
+                    'session':f'{self.session}/{name}'})
+
+############################################
+############################################
+
+############################################
+####	Main Script ####
+############################################
+
+    def run(self):
+        #Split processes into groups
+        igroup = semp.divide_groups(self.n_groups)
+
+        #Save list of runs
+        if semp.zero_rank:
+            self.util.create_directory(self.data_dir)
+            pickle.dump(self.tasks, open(f'{self.data_dir}/ensemble.pck', 'wb'))
+            print(f'\n*** Running {len(self.tasks)} simulations on {self.n_groups} ' + \
+                f'groups ({semp.mpi_size} processes) ***\n')
+
+        #Run this group's simulations
+        for task in self.tasks:
+            if task['group'] == igroup:
+                self.run_task(task)
+
+        #Wait for all groups
+        semp.mpi_barrier()
+
+        #Combine polarizations of each wavelength into single session
+        if semp.zero_rank:
+            for wave in self.waves:
+                self.merge_sessions(wave)
+        semp.mpi_barrier()
+
+    def run_task(self, task):
+        #Parameters for this run
+        meep_params = self.util.deepcopy(self.meep_params)
+        prop_params = self.util.deepcopy(self.prop_params)
+        meep_params['wave'] = task['wave']
+        meep_params['polars'] = [task['pol']]
+        prop_params['session'] = task['session']
+
+        #Run simulation (rank 0 of group writes output)
+        prop = semp.Propagator(meep_params, prop_params)
+        prop.run_sim()
+
+############################################
+############################################
+
+############################################
+####	Merge Sessions ####
+############################################
+
+    def get_wave_session(self, wave):
+        #Session holding all polarizations (as from single Propagator run)
+        return f'{self.session}/{wave*1e3:.0f}nm'
+
+    def merge_sessions(self, wave):
+        #Sessions of each polarization
+        tasks = [task for task in self.tasks if task['wave'] == wave]
+        src_dirs = [f"{self.base_dir}/{task['session']}" for task in tasks]
+
+        #Merged session
+        dst_dir = self.util.create_directory(f'{self.base_dir}/{self.get_wave_session(wave)}')
+
+        #Parameters with all polarizations
+        params = pickle.load(open(f'{src_dirs[0]}/parameters.pck', 'rb'))
+        params['MEEP_params']['polars'] = [task['pol'] for task in tasks]
+        params['PROP_params']['session'] = self.get_wave_session(wave)
+        pickle.dump(params, open(f'{dst_dir}/parameters.pck', 'wb'))
+        pickle.dump(semp.utils.def_params, open(f'{dst_dir}/def_params.pck', 'wb'))
+
+        #Link outputs and combine vacuum directories and run info
+        vac_dirs, run_info = {}, {}
+        for task, src_dir in zip(tasks, src_dirs):
+            self.link_outputs(src_dir, dst_dir)
+
+            #Vacuum stored in cache or with outputs (now linked into merged session)
+            if os.path.exists(f'{src_dir}/vac_dirs.pck'):
+                vac_dirs.update(pickle.load(open(f'{src_dir}/vac_dirs.pck', 'rb')))
+            else:
+                vac_dirs[task['pol']] = dst_dir
+
+            if os.path.exists(f'{src_dir}/run_info.pck'):
+                run_info.update(pickle.load(open(f'{src_dir}/run_info.pck', 'rb')))
+
+        pickle.dump(vac_dirs, open(f'{dst_dir}/vac_dirs.pck', 'wb'))
+        pickle.dump(run_info, open(f'{dst_dir}/run_info.pck', 'wb'))
+
+    def link_outputs(self, src_dir, dst_dir):
+        #Field and metadata files (metadata is same for all polarizations, keep first)
+        for fname in glob.glob(f'{src_dir}/*.h5') + glob.glob(f'{src_dir}/*.npy'):
+            dst = f'{dst_dir}/{os.path.basename(fname)}'
+            if os.path.basename(fname) == semp.Propagator.single_file:
+                self.link_datasets(fname, dst)
+            elif not os.path.lexists(dst):
+                os.symlink(os.path.realpath(fname), dst)
+
+    def link_datasets(self, src_file, dst_file):
+        #Single files are combined with links to each dataset
+        with h5py.File(dst_file, 'a', libver='latest') as f:
+            with h5py.File(src_file, 'r') as g:
+                for name in g.keys():
+                    if name not in f:
+                        f[name] = h5py.ExternalLink(os.path.realpath(src_file), name)
+                for k, v in g.attrs.items():
+                    if k not in f.attrs:
+                        f.attrs[k] = v
+
+############################################
+############################################
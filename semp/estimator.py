@@ -0,0 +1,222 @@
+"""
+estimator.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Preflight estimate of memory and wall time of a SEMP simulation,
+    computed from the parameters without initializing Meep
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import semp
+import numpy as np
+import meep as mp
+import json
+import os
+
+#Default calibration (used when no calibration file exists)
+def_calibration = {
+    'machine':                  'uncalibrated',
+    'time_per_point_step':      2.e-8,      # Seconds per grid point per step (one process)
+    'time_per_pole':            0.5,        # Extra fraction of step time per Lorentzian pole
+    'parallel_efficiency':      0.8,        # Strong scaling efficiency
+    'mem_overhead_per_rank':    2.e8,       # Bytes of Meep + python per process
+}
+
+############################################
+####	Estimate ####
+############################################
+
+def estimate(meep_params, prop_params=None, nprocs=None, calib_file=None, verbose=True):
+    """Estimate memory per rank, number of time steps, and wall time of run"""
+
+    #Number of processes
+    if nprocs is None:
+        nprocs = semp.mpi_size
+
+    #Build geometry without running meep
+    prop = semp.Propagator(meep_params, prop_params, is_analysis=True)
+    msim = prop.msim
+    geo = msim.geo
+
+    #Load calibration
+    calib = load_calibration(calib_file)
+
+    #Runs (polarization groups, plus simulated vacuum)
+    n_pols = len(prop.get_pol_groups())
+    n_comps = [6, 3*len(prop.get_pol_groups()[0])][int(geo.ndims == 2)]
+
+    #Grid points (half with mirror symmetry)
+    n_points = np.prod([l*msim.resolution for l in [geo.lx, geo.ly, geo.lz] if l > 0])
+    n_points *= [1, 0.5][int(geo.has_y_symm)]
+    n_vac_points = geo.lx * msim.resolution
+
+    #Fraction of grid in PML (always in x) and absorber (y and z, if used)
+    pml_frac = get_boundary_fraction(geo, [msim.pmlx] + [msim.pmly, msim.pmlz] * \
+        int(not msim.use_absorber))
+    abs_frac = get_boundary_fraction(geo, [0, msim.pmly, msim.pmlz]) * int(msim.use_absorber)
+
+    #Time steps
+    n_steps = get_n_steps(msim)
+
+    #Field arrays per grid point
+    n_arrays, n_poles = get_field_arrays(msim, n_comps, pml_frac, abs_frac)
+
+    #DFT arrays over output regions
+    n_dft = 0
+    if msim.is_broadband or msim.dft_periods is not None:
+        n_dft = len(msim.fcens) * n_comps * get_output_fraction(prop)
+
+    #Memory [bytes] (complex doubles)
+    mem_total = 16. * n_points * (n_arrays + n_dft)
+    mem_per_rank = mem_total / nprocs + calib['mem_overhead_per_rank']
+
+    #Wall time [s] (scatterer + vacuum runs)
+    step_cost = calib['time_per_point_step'] * (1. + calib['time_per_pole']*n_poles)
+    speedup = max(1., nprocs * calib['parallel_efficiency'])
+    time_per_run = n_points * n_steps * step_cost / speedup
+    time_vac = [n_vac_points * n_steps * calib['time_per_point_step'], 0][int(prop.analytic_vac)]
+    wall_time = n_pols * (time_per_run + time_vac)
+
+    est = {
+        'machine':          calib['machine'],
+        'nprocs':           nprocs,
+        'ndims':            geo.ndims,
+        'n_points':         float(n_points),
+        'n_steps':          n_steps,
+        'n_runs':           n_pols,
+        'n_field_arrays':   float(n_arrays),
+        'n_poles':          n_poles,
+        'mem_total':        float(mem_total),
+        'mem_per_rank':     float(mem_per_rank),
+        'time_per_run':     float(time_per_run),
+        'wall_time':        float(wall_time),
+    }
+
+    #Print
+    if verbose and semp.zero_rank:
+        print_estimate(est)
+
+    return est
+
+def get_n_steps(msim):
+    #Simulated time (phasor runs accumulate DFT within run time)
+    sim_time = msim.run_time
+
+    #Broadband runs until run time after pulse has passed (start + 2*cutoff*width)
+    if msim.is_broadband:
+        src = mp.GaussianSource(msim.fcen, fwidth=msim.fwidth)
+        sim_time += src.start_time + 2*src.cutoff*src.width
+
+    #Courant is dt in units of dx
+    dt = msim.courant / msim.resolution
+
+    return int(np.ceil(sim_time / dt))
+
+def get_boundary_fraction(geo, thicks):
+    #Fraction of grid within boundary layers of thickness (x, y, z) on both sides
+    thicks = list(thicks) + [0]*(3 - len(thicks))
+    lens = [geo.lx, geo.ly, geo.lz]
+    return 1. - np.prod([(l - 2*t)/l for l, t in zip(lens, thicks) if l > 0])
+
+def get_field_arrays(msim, n_comps, pml_frac, abs_frac=0.):
+    #Unique materials in geometry
+    mats = {id(ob.material): ob.material for ob in msim.get_geometry(False)}.values()
+
+    #Lorentzian poles
+    n_poles = sum([len(getattr(m, 'E_susceptibilities', [])) + \
+        len(getattr(m, 'H_susceptibilities', [])) for m in mats])
+
+    #Conductivity adds array per component
+    is_cond = any([getattr(m, 'D_conductivity_diag', mp.Vector3()).norm() > 0 for m in mats])
+
+    #E+D or H+B at each component (complex, since force_complex_fields)
+    n_arrays = 2.*n_comps
+    #Inverse permittivity and conductivity (real, so half complex array)
+    n_arrays += 0.5*n_comps * (1 + int(is_cond))
+    #Polarization + previous step for each pole at E components
+    n_arrays += 2.*n_poles * n_comps/2
+    #PML auxiliary fields
+    n_arrays += 2.*n_comps * pml_frac
+    #Absorber is conductivity (only adds array if not already conductive)
+    n_arrays += 0.5*n_comps * abs_frac * int(not is_cond)
+
+    return n_arrays, n_poles
+
+def get_output_fraction(prop):
+    #Fraction of cell covered by DFT output regions
+    geo = prop.msim.geo
+    vols = prop.msim.get_output_volumes(False)
+    if vols is None:
+        return 1.
+
+    cell = np.prod([l for l in [geo.lx, geo.ly, geo.lz] if l > 0])
+    res = prop.msim.resolution
+    frac = 0.
+    for vol in vols:
+        sze = [max(s, 1/res) for s, l in zip([vol.size.x, vol.size.y, vol.size.z], \
+            [geo.lx, geo.ly, geo.lz]) if l > 0]
+        frac += np.prod(sze) / cell
+
+    return min(frac, 1.)
+
+############################################
+############################################
+
+############################################
+####	Calibration ####
+############################################
+
+def load_calibration(calib_file=None):
+    if calib_file is None:
+        calib_file = semp.calibration_file
+
+    #Start with defaults
+    calib = semp.utils.util.deepcopy(def_calibration)
+
+    #Overwrite with measured values
+    if os.path.exists(calib_file):
+        with open(calib_file, 'r') as f:
+            calib.update(json.load(f))
+
+    return calib
+
+def save_calibration(calib, calib_file=None):
+    if calib_file is None:
+        calib_file = semp.calibration_file
+
+    #Merge with existing calibration
+    new_calib = load_calibration(calib_file)
+    new_calib.update(calib)
+
+    if semp.zero_rank:
+        semp.utils.util.create_directory(os.path.dirname(calib_file))
+        with open(calib_file, 'w') as f:
+            json.dump(new_calib, f, indent=2)
+
+    return new_calib
+
+############################################
+############################################
+
+############################################
+####	Printing ####
+############################################
+
+def print_estimate(est):
+    print('\n' + '*'*40)
+    print(f'*** SEMP Estimate ({est["ndims"]}D, {est["nprocs"]} processes, ' + \
+        f'calibration: {est["machine"]}) ***')
+    print(f'*** Grid points:     {est["n_points"]:.3e} ***')
+    print(f'*** Time steps:      {est["n_steps"]} x {est["n_runs"]} runs ***')
+    print(f'*** Field arrays:    {est["n_field_arrays"]:.1f} ({est["n_poles"]} poles) ***')
+    print(f'*** Memory total:    {est["mem_total"]/1e9:.2f} [GB] ***')
+    print(f'*** Memory per rank: {est["mem_per_rank"]/1e9:.2f} [GB] ***')
+    print(f'*** Wall time:       {est["wall_time"]/3600:.2f} [hr] ***')
+    print('*'*40 + '\n')
+
+############################################
+############################################
@@ -0,0 +1,372 @@
+"""
+job_queue.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: File-based job queue for running SEMP sweeps with workers on any
+    number of nodes sharing a filesystem
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import semp
+import os
+import time
+import json
+import socket
+import argparse
+import ast
+import threading
+import subprocess
+
+class Job_Queue(object):
+
+    def __init__(self, params={}):
+        self.util = semp.utils.Utilities()
+        #Initialize
+        self.initialize(params)
+
+############################################
+####	Initialization ####
+############################################
+
+    def initialize(self, params):
+        #Set sweep parameters
+        self.util.set_default_params(self, params, semp.utils.def_params_SWEEP)
+
+        #Directories (jobs are written by Sweep.submit)
+        self.sweep_dir = f'{self.base_dir}/{self.session}'
+        self.jobs_dir = f'{self.sweep_dir}/jobs'
+        self.claims_dir = f'{self.sweep_dir}/claims'
+        self.done_dir = f'{self.sweep_dir}/done'
+        self.failed_dir = f'{self.sweep_dir}/failed'
+
+        #Unique worker name
+        self.worker_id = f'{socket.gethostname()}-{os.getpid()}'
+
+############################################
+############################################
+
+############################################
+####	Main Script ####
+############################################
+
+    def work(self):
+        #Create directories
+        for dd in [self.claims_dir, self.done_dir, self.failed_dir]:
+            self.util.create_directory(dd)
+
+        #Print
+        print(f'\n*** Worker {self.worker_id} starting on {self.sweep_dir} ***\n')
+
+        #Loop until no jobs remain
+        n_run = 0
+        while True:
+
+            #Claim next job
+            name, is_remaining = self.claim_next()
+
+            #Wait for other workers (their claims may go stale)
+            if name is None:
+                if not is_remaining:
+                    break
+                time.sleep(self.poll_dt)
+                continue
+
+            #Run job
+            self.run_job(name)
+            n_run += 1
+
+        #Print
+        print(f'\n*** Worker {self.worker_id} finished after {n_run} jobs ***\n')
+
+        return n_run
+
+    def claim_next(self):
+        #Loop through jobs in order
+        is_remaining = False
+        for name in self.get_job_names():
+
+            #Skip finished jobs
+            status = self.get_status(name)
+            if status in ['done', 'failed']:
+                continue
+            is_remaining = True
+
+            #Try to claim
+            if status == 'pending' and self.claim_job(name):
+                return name, True
+
+        return None, is_remaining
+
+############################################
+############################################
+
+############################################
+####	Job Status ####
+############################################
+
+    def get_job_names(self):
+        #All job files
+        names = sorted([f[:-4] for f in os.listdir(self.jobs_dir) if f.endswith('.pck')])
+
+        #Order longest first (from sweep manifest)
+        manifest_file = f'{self.sweep_dir}/manifest.json'
+        if os.path.exists(manifest_file):
+            with open(manifest_file, 'r') as f:
+                costs = {k: v.get('cost', 0) for k, v in json.load(f).items()}
+            names.sort(key=lambda name: costs.get(name, 0), reverse=True)
+
+        return names
+
+    def get_status(self, name):
+        #Finished
+        if os.path.exists(f'{self.done_dir}/{name}'):
+            return 'done'
+
+        #Failed too many times
+        if self.get_n_failures(name) > self.max_retries:
+            return 'failed'
+
+        #Claimed by live worker
+        lock = self.get_lock_file(name)
+        if os.path.exists(lock) and not self.is_stale(lock):
+            return 'claimed'
+
+        return 'pending'
+
+    def get_summary(self):
+        #Count jobs in each state
+        summary = {'pending':0, 'claimed':0, 'done':0, 'failed':0}
+        for name in self.get_job_names():
+            summary[self.get_status(name)] += 1
+        return summary
+
+    def get_n_failures(self, name):
+        fname = f'{self.failed_dir}/{name}'
+        if not os.path.exists(fname):
+            return 0
+        with open(fname, 'r') as f:
+            return int(f.read().strip() or 0)
+
+############################################
+############################################
+
+############################################
+####	Locking ####
+############################################
+
+    def get_lock_file(self, name):
+        return f'{self.claims_dir}/{name}.lock'
+
+    def is_stale(self, fname):
+        try:
+            return time.time() - os.path.getmtime(fname) > self.stale_time
+        except FileNotFoundError:
+            return False
+
+    def claim_job(self, name):
+        lock = self.get_lock_file(name)
+
+        #Remove claim of dead worker
+        if os.path.exists(lock):
+            self.break_stale_lock(lock)
+
+        #Create lock atomically (fails if exists)
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+
+        #Record owner
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'worker':self.worker_id, 'time':time.time()}, f)
+
+        #Job may have finished after status was checked
+        if os.path.exists(f'{self.done_dir}/{name}'):
+            self.release_own_lock(lock)
+            return False
+
+        return True
+
+    def break_stale_lock(self, lock):
+        brk = f'{lock}.break'
+
+        #Clear breaker abandoned by dead worker
+        if self.is_stale(brk):
+            self.release_lock(brk)
+
+        #Only one worker may break lock
+        try:
+            os.close(os.open(brk, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            return
+
+        #Recheck while holding breaker, then remove
+        try:
+            if self.is_stale(lock):
+                self.release_lock(lock)
+                print(f'*** Reclaimed stale job: {os.path.basename(lock)[:-5]} ***')
+        finally:
+            self.release_lock(brk)
+
+    def release_lock(self, lock):
+        try:
+            os.remove(lock)
+        except FileNotFoundError:
+            pass
+
+    def is_owner(self, lock):
+        #Lock may have been reclaimed as stale by another worker
+        try:
+            with open(lock, 'r') as f:
+                return json.load(f).get('worker') == self.worker_id
+        except (FileNotFoundError, ValueError):
+            return False
+
+    def release_own_lock(self, lock):
+        #Only remove claim held by this worker
+        if self.is_owner(lock):
+            self.release_lock(lock)
+
+    def heartbeat(self, lock, stop_event):
+        #Touch lock until job finishes (only while still owned)
+        while not stop_event.wait(self.heartbeat_dt):
+            if not self.is_owner(lock):
+                continue
+            try:
+                os.utime(lock)
+            except FileNotFoundError:
+                pass
+
+############################################
+############################################
+
+############################################
+####	Run Job ####
+############################################
+
+    def run_job(self, name):
+        lock = self.get_lock_file(name)
+        job_file = f'{self.jobs_dir}/{name}.pck'
+
+        #Print
+        print(f'*** {self.worker_id} running: {name} ***')
+
+        #Start heartbeat
+        stop_event = threading.Event()
+        beat = threading.Thread(target=self.heartbeat, args=(lock, stop_event), daemon=True)
+        beat.start()
+
+        #Run and log output
+        tik = time.perf_counter()
+        with open(f'{self.jobs_dir}/{name}.log', 'a') as f:
+            out = subprocess.run(semp.sweep.get_job_cmd(job_file, self), \
+                stdout=f, stderr=subprocess.STDOUT)
+        duration = time.perf_counter() - tik
+
+        #Stop heartbeat
+        stop_event.set()
+        beat.join()
+
+        #Claim reclaimed as stale by another worker: its run owns the result
+        if not self.is_owner(lock):
+            print(f'*** {self.worker_id} lost claim, dropping result: {name} ***')
+            return out.returncode
+
+        #Mark done or add failure (still holding claim)
+        if out.returncode == 0:
+            with open(f'{self.done_dir}/{name}', 'w') as f:
+                json.dump({'worker':self.worker_id, 'duration':duration}, f)
+        else:
+            n_fail = self.get_n_failures(name) + 1
+            with open(f'{self.failed_dir}/{name}', 'w') as f:
+                f.write(f'{n_fail}')
+
+        #Release claim
+        self.release_own_lock(lock)
+
+        #Print
+        status = ['failed', 'done'][int(out.returncode == 0)]
+        print(f'*** {self.worker_id} {status}: {name} ({duration:.1f} [s]) ***')
+
+        return out.returncode
+
+############################################
+############################################
+
+############################################
+####	Command Line ####
+############################################
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='semp', description='SEMP job queue and results catalog')
+    subs = parser.add_subparsers(dest='command')
+
+    #Worker
+    wrk = subs.add_parser('worker', help='Run jobs from sweep directory until none remain')
+    wrk.add_argument('sweep_dir', help='Directory of sweep (base_dir/session)')
+    wrk.add_argument('--n_procs', type=int, default=1, help='MPI processes per job')
+    wrk.add_argument('--mpirun', default='mpirun', help="MPI launcher ('none' for no MPI)")
+
+    #Status
+    sts = subs.add_parser('status', help='Print number of jobs in each state')
+    sts.add_argument('sweep_dir', help='Directory of sweep (base_dir/session)')
+
+    #Catalog
+    cat = subs.add_parser('catalog', help='Rescan or query results catalog')
+    cat.add_argument('action', choices=['rescan', 'query'])
+    cat.add_argument('terms', nargs='*', help="Directory to rescan, or query terms 'name=value'")
+    cat.add_argument('--status', default=None, help='Only sessions with this status')
+
+    opts = parser.parse_args(args)
+
+    #Catalog commands don't use queue
+    if opts.command == 'catalog':
+        run_catalog(opts)
+        return
+
+    #Build queue
+    sweep_dir = os.path.abspath(opts.sweep_dir)
+    params = {'base_dir':os.path.dirname(sweep_dir), 'session':os.path.basename(sweep_dir)}
+
+    if opts.command == 'worker':
+        params['n_procs'] = opts.n_procs
+        params['mpirun'] = [opts.mpirun, None][int(opts.mpirun.lower() == 'none')]
+        Job_Queue(params).work()
+
+    elif opts.command == 'status':
+        print(Job_Queue(params).get_summary())
+
+    else:
+        parser.print_help()
+
+def run_catalog(opts):
+    catalog = semp.utils.Catalog()
+
+    #Rebuild from directories
+    if opts.action == 'rescan':
+        for base_dir in opts.terms or [semp.results_dir]:
+            print(f'Cataloged {catalog.rescan(base_dir)} sessions in {base_dir}')
+        return
+
+    #Query terms as python values (fall back to string)
+    criteria = {}
+    for term in opts.terms:
+        name, val = term.split('=', 1)
+        try:
+            criteria[name] = ast.literal_eval(val)
+        except (ValueError, SyntaxError):
+            criteria[name] = val
+
+    #Print matches
+    for row in catalog.query(status=opts.status, **criteria):
+        print(f'{row["status"]:>10s} {row["param_hash"]} {row["data_dir"]}')
+
+if __name__ == '__main__':
+    main()
+
+############################################
+############################################
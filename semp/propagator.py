@@ -14,9 +14,19 @@ import semp
 import numpy as np
 import meep as mp
 import h5py
+import os
+import shutil
+import pickle
+import sqlite3
+import hashlib
+import uuid
+import time
 
 class Propagator(object):
 
+    ### HARDWIRED ###
+    single_file = 'fields.h5'       # All outputs of directory with 'output_format' = 'single'
+
     def __init__(self, meep_params, prop_params=None, is_analysis=False):
         self.util = semp.utils.util
         self.is_analysis = is_analysis
@@ -42,13 +52,40 @@ class Propagator(object):
         #Load Meep simulation class
         self.msim = semp.simulation.Meep_Sim(self, self.params['MEEP_params'])
 
+        #Set type of output region
+        self.set_output_type()
+
         #Load logger class
         self.logger = semp.utils.Logger(self)
 
+        #Datasets written to single output files (file, name)
+        self.single_outputs = []
+
         #Verbosity
         if not self.verbose:
             mp.verbosity(0)
 
+    def set_output_type(self):
+        #Full cell, unless DFT phasors (always non-PML)
+        if self.output_region is None:
+            self.output_type = ['full', 'nonpml'][int(self.msim.dft_periods is not None)]
+
+        #Named region
+        elif isinstance(self.output_region, str):
+            if self.output_region not in ['full', 'nonpml']:
+                bad_str = self.util.color_string('!*!', self.util.bad_color)
+                print(f'\n{bad_str} Invalid Output Region: {self.output_region} {bad_str}\n')
+                import sys; sys.exit(0)
+            self.output_type = self.output_region
+
+        #Explicit volumes: (center, size) pairs (or mp.Volume)
+        elif all([isinstance(reg, (tuple, list, mp.Volume)) for reg in self.output_region]):
+            self.output_type = 'volumes'
+
+        #Observation planes
+        else:
+            self.output_type = 'planes'
+
 ############################################
 ############################################
 
@@ -87,11 +124,17 @@ class Propagator(object):
         #Flag to get metadata
         get_meta = True
 
-        #Loop over polarizations
-        for pol in self.msim.polars:
+        #Directories holding vacuum runs
+        self.vac_dirs = {}
+
+        #Simulation kept between polarizations
+        self.kept_sim = None
+
+        #Loop over polarizations (or joint s+p)
+        for pol in self.get_pol_groups():
 
-            #Loop over vacuum
-            for is_vac in [True, False]:
+            #Loop over vacuum (skip if analytic)
+            for is_vac in [[True, False], [False]][int(self.analytic_vac)]:
 
                 #Run sim
                 self.run_single_to_end(pol, is_vac, get_meta)
@@ -99,70 +142,280 @@ class Propagator(object):
             #Turn off flag
             get_meta = False
 
+        #Release kept simulation
+        if self.kept_sim is not None:
+            self.kept_sim.reset_meep()
+            self.kept_sim = None
+
+    def get_pol_groups(self):
+        #Separate runs
+        if not self.joint_polarization:
+            return list(self.msim.polars)
+
+        #Joint s+p only in 2D, and without mirror symmetry (s and p phases differ)
+        if self.msim.geo.ndims == 2 and sorted(self.msim.polars) == ['p', 's'] and \
+            not self.msim.geo.has_y_symm:
+            return ['sp']
+
+        #Print
+        self.logger.write('Joint polarization not possible, running separately', \
+            is_time=False)
+
+        return list(self.msim.polars)
+
     def run_single_to_end(self, pol, is_vac, get_meta):
 
-        #Build to simulation
-        sim = self.msim.build_sim(pol=pol, is_vac=is_vac)
+        #Default output directory
+        data_dir = self.logger.data_dir
+
+        #Check vacuum cache
+        if is_vac and self.use_vac_cache:
+
+            #Get cache directory
+            data_dir, is_cached = self.get_vac_cache(pol)
+
+            #Return if already run
+            if is_cached:
+                self.logger.write(f'Using cached vacuum: {data_dir}')
+                return
+
+            #Always store vacuum metadata with cache
+            get_meta = True
+
+        #Label timing spans of this run
+        self.logger.span_run = f'{["", "vac_"][int(is_vac)]}{pol}'
+
+        #Skip runs finished before restart
+        done_key = f'{["", "vac_"][int(is_vac)]}done_{pol}'
+        if self.resume and self.logger.load_run_info(data_dir=data_dir).get(done_key):
+            self.logger.write(f'Skipping finished run: {done_key}')
+            #Vacuum may have finished before it was moved into cache
+            if is_vac and self.use_vac_cache:
+                self.finish_vac_cache(data_dir, pol)
+            return
+
+        #Runs memoized through catalog (cached vacuum has its own cache)
+        is_memo = not (is_vac and self.use_vac_cache)
+
+        #Link identical run finished elsewhere in results tree
+        if is_memo and self.reuse_existing and \
+            self.link_existing_run(pol, is_vac, get_meta, data_dir, done_key):
+            return
+
+        #Outputs present before run
+        if is_memo:
+            old_state = self.get_run_state(data_dir)
+
+        #Run sim
+        if self.msim.is_broadband:
+            self.run_single_broadband(pol, is_vac, get_meta, data_dir)
+        elif self.msim.dft_periods is not None:
+            self.run_single_phasor(pol, is_vac, get_meta, data_dir)
+        elif self.engine == 'frequency_domain':
+            self.run_single_frequency(pol, is_vac, get_meta, data_dir)
+        else:
+            self.run_single_cw(pol, is_vac, get_meta, data_dir)
+
+        #Mark run finished
+        self.logger.save_run_info(done_key, True, data_dir=data_dir)
+
+        #Record outputs of run for reuse
+        if is_memo:
+            self.save_run_record(pol, is_vac, data_dir, done_key, old_state)
+
+        #Mark cache complete
+        if is_vac and self.use_vac_cache:
+            self.finish_vac_cache(data_dir, pol)
+
+    def run_single_cw(self, pol, is_vac, get_meta, data_dir):
+
+        #Start timer
+        tik = time.perf_counter()
+
+        #Checkpoint to resume from
+        ckpt_dir = self.get_checkpoint_dir(data_dir, pol, is_vac)
+        has_ckpt = self.has_checkpoint(ckpt_dir)
+
+        #Build to simulation (or reuse previous structure)
+        with self.logger.span('build'):
+            sim = self.get_sim(pol, is_vac, has_ckpt=has_ckpt)
 
         #Set output directory + prefix
-        sim.use_output_directory(self.logger.data_dir)
+        sim.use_output_directory(data_dir)
         sim.filename_prefix = ['', 'vac'][int(is_vac)]
 
         #Get fields to output
-        if self.save_all:
-            fld_names = {'s':['efield_z','hfield_x','hfield_y'], \
-                'p':['hfield_z','efield_x','efield_y']}[pol]
+        fld_names = self.get_field_names(pol)
+
+        #Regions to output (None is full cell)
+        vols = self.msim.get_output_volumes(is_vac)
+
+        #Output functions (timed)
+        if vols is None and self.output_format == 'files':
+            fld_outs = [self.logger.timed('field_output', getattr(mp, f'output_{fn}')) \
+                for fn in fld_names]
         else:
-            fld_names = {'s':['efield_z','hfield_y'], \
-                'p':['hfield_z','efield_y']}[pol]
+            fld_outs = [lambda sim: self.save_fields(sim, fld_names, is_vac, data_dir, vols)]
 
-        fld_outs = [getattr(mp, f'output_{fn}') for fn in fld_names]
+        #Checkpointing
+        ckpt_funcs = self.get_checkpoint_funcs(ckpt_dir, self.msim.run_time)
+
+        with self.logger.span('init'):
+
+            #Restart from checkpoint
+            self.load_checkpoint(sim, ckpt_dir)
+
+            #Load or store initialized structure
+            self.load_structure_cache(sim, is_vac)
+
+            #Initialize
+            if sim.structure is None:
+                sim.init_sim()
+
+        #Record layout of chunks
+        self.logger.record_chunks(sim)
+        tok = time.perf_counter()
+
+        #Progress reports (from resumed time, after initialization)
+        prog_funcs = self.get_progress_funcs(sim, self.msim.run_time)
+
+        #Stop at fixed time or when steady state is reached
+        until = self.get_stop_condition(sim, pol, is_vac, self.msim.run_time)
 
         #Run sim
-        sim.run(mp.at_end(mp.synchronized_magnetic(*fld_outs)), \
-            until=self.msim.run_time)
+        with self.logger.span('stepping'):
+            sim.run(mp.at_end(mp.synchronized_magnetic(*fld_outs)), *ckpt_funcs, \
+                *prog_funcs, until=until)
+
+        #Log timing
+        self.log_timing(pol, is_vac, tok - tik, time.perf_counter() - tok, data_dir)
+
+        #Remove checkpoint
+        self.clean_checkpoint(ckpt_dir)
+
+        #Record number of periods run
+        self.logger.save_run_info(f'{["", "vac_"][int(is_vac)]}n_periods_{pol}', \
+            sim.meep_time()/self.msim.wave, data_dir=data_dir)
 
         #Output times
-        fname = f'{self.logger.data_dir}/{["", "vac-"][int(is_vac)]}times_{pol}'
+        fname = f'{data_dir}/{["", "vac-"][int(is_vac)]}times_{pol}'
         sim.output_times(fname)
 
         #Get metadata
         if get_meta:
+            self.save_metadata(sim, is_vac, data_dir, vols=vols)
 
-            #Get dielectric
-            eps = sim.get_array(component=mp.Dielectric)
+        #Reset meep (or keep for next polarization)
+        self.release_sim(sim, is_vac)
 
-            #Get coordinates
-            x,y,z,w = sim.get_array_metadata()
+############################################
+############################################
 
-            #Get run time
-            run_time = sim.meep_time()
+############################################
+####	Simulation Reuse ####
+############################################
 
-            #Save metadata
-            if semp.zero_rank:
+    def can_reuse_sim(self, is_vac):
+        #Only non-vacuum structures without mirror symmetry (phase differs for s/p)
+        return self.reuse_sim and not is_vac and not self.msim.geo.has_y_symm
 
-                #Prefix
-                pre = f"{self.logger.data_dir}/{['', 'vac-'][int(is_vac)]}"
-                pst = f"-{run_time:09.2f}"
+    def get_sim(self, pol, is_vac, has_ckpt=False):
 
-                #Save dielectric
-                with h5py.File(f'{pre}eps{pst}.h5', 'w') as f:
-                    f.create_dataset('dielectric', data=eps)
+        #Checkpoint is loaded with its structure into new simulation
+        if has_ckpt and self.kept_sim is not None:
+            self.kept_sim.reset_meep()
+            self.kept_sim = None
 
-                #Save coordinates
-                with h5py.File(f'{pre}coords{pst}.h5', 'w') as f:
-                    f.create_dataset('xx', data=x)
-                    f.create_dataset('yy', data=y)
-                    f.create_dataset('zz', data=z)
+        #Build new simulation
+        if not (self.can_reuse_sim(is_vac) and self.kept_sim is not None):
+            return self.msim.build_sim(pol=pol, is_vac=is_vac)
 
-                #Save run time
-                np.save(f'{self.logger.data_dir}/time_ext', run_time)
+        #Reuse structure: zero fields and swap sources
+        sim = self.kept_sim
+        self.kept_sim = None
+        sim.restart_fields()
+        sim.change_sources(self.msim.get_source(pol, is_vac))
 
-            #Wait
-            semp.mpi_barrier()
+        #Print
+        self.logger.write(f'Reusing structure for {pol}-polarization', is_time=False)
 
-            #Cleanup
-            del eps, x, y, z
+        return sim
+
+    def release_sim(self, sim, is_vac):
+        #Keep for next polarization
+        if self.can_reuse_sim(is_vac):
+            self.kept_sim = sim
+        else:
+            sim.reset_meep()
+
+    def log_timing(self, pol, is_vac, init_time, run_time, data_dir):
+        #Run name
+        name = f'{["", "vac_"][int(is_vac)]}{pol}'
+
+        #Print
+        self.logger.write(f'Run {name}: init {init_time:.2f} [s], ' + \
+            f'stepping {run_time:.2f} [s]', is_time=False)
+
+        #Store
+        self.logger.save_run_info(f'init_time_{name}', init_time, data_dir=data_dir)
+        self.logger.save_run_info(f'step_time_{name}', run_time, data_dir=data_dir)
+
+############################################
+############################################
+
+############################################
+####	Frequency Domain Simulation ####
+############################################
+
+    def run_single_frequency(self, pol, is_vac, get_meta, data_dir):
+
+        #Start timer
+        tik = time.perf_counter()
+
+        #Build to simulation (initialized)
+        with self.logger.span('build'):
+            sim = self.msim.build_sim(pol=pol, is_vac=is_vac, engine='frequency_domain')
+        self.logger.record_chunks(sim)
+        tok = time.perf_counter()
+
+        #Set output directory + prefix
+        sim.use_output_directory(data_dir)
+        sim.filename_prefix = ['', 'vac'][int(is_vac)]
+
+        #Solve for steady state
+        with self.logger.span('stepping'):
+            sim.solve_cw(self.msim.cw_tol, self.msim.cw_maxiters, self.msim.cw_L)
+
+        #Log timing (same run info as time domain)
+        self.log_timing(pol, is_vac, tok - tik, time.perf_counter() - tok, data_dir)
+
+        #Record number of periods run (solver does not advance time)
+        self.logger.save_run_info(f'{["", "vac_"][int(is_vac)]}n_periods_{pol}', \
+            sim.meep_time()/self.msim.wave, data_dir=data_dir)
+
+        #Output times
+        fname = f'{data_dir}/{["", "vac-"][int(is_vac)]}times_{pol}'
+        sim.output_times(fname)
+
+        #Get fields to output
+        fld_names = self.get_field_names(pol)
+
+        #Regions to output (None is full cell)
+        vols = self.msim.get_output_volumes(is_vac)
+
+        #Output fields (synchronized as in time domain)
+        sim.fields.synchronize_magnetic_fields()
+        if vols is None and self.output_format == 'files':
+            with self.logger.span('field_output'):
+                for fn in fld_names:
+                    getattr(mp, f'output_{fn}')(sim)
+        else:
+            self.save_fields(sim, fld_names, is_vac, data_dir, vols)
+        sim.fields.restore_magnetic_fields()
+
+        #Get metadata
+        if get_meta:
+            self.save_metadata(sim, is_vac, data_dir, vols=vols)
 
         #Reset meep
         sim.reset_meep()
@@ -170,6 +423,755 @@ class Propagator(object):
 ############################################
 ############################################
 
+############################################
+####	Phasor Simulation ####
+############################################
+
+    def run_single_phasor(self, pol, is_vac, get_meta, data_dir):
+
+        #Build to simulation
+        with self.logger.span('build'):
+            sim = self.msim.build_sim(pol=pol, is_vac=is_vac)
+
+        #Get fields to output
+        fld_names = self.get_field_names(pol)
+        comps = [self.get_field_component(fn) for fn in fld_names]
+
+        #Load or store initialized structure
+        with self.logger.span('init'):
+            self.load_structure_cache(sim, is_vac)
+            if sim.structure is None:
+                sim.init_sim()
+        self.logger.record_chunks(sim)
+
+        #Time to accumulate DFT over
+        dft_time = min(self.msim.dft_periods*self.msim.wave, self.msim.run_time)
+
+        #Run through transient (or until steady state)
+        until = self.get_stop_condition(sim, pol, is_vac, self.msim.run_time - dft_time)
+        prog_funcs = self.get_progress_funcs(sim, self.msim.run_time)
+        with self.logger.span('stepping'):
+            sim.run(*prog_funcs, until=until)
+
+        #Add DFT monitors over output regions (default to entire cell)
+        vols = self.msim.get_output_volumes(is_vac)
+        if vols is None:
+            vols = [mp.Volume(center=mp.Vector3(), size=sim.cell_size)]
+        dft_objs = [sim.add_dft_fields(comps, [self.msim.fcen], where=vol) for vol in vols]
+
+        #Accumulate DFT over final periods
+        with self.logger.span('stepping'):
+            sim.run(*prog_funcs, until=dft_time)
+
+        #Record number of periods run
+        self.logger.save_run_info(f'{["", "vac_"][int(is_vac)]}n_periods_{pol}', \
+            sim.meep_time()/self.msim.wave, data_dir=data_dir)
+
+        #Save phasors
+        self.save_fields(sim, fld_names, is_vac, data_dir, vols, dft_objs=dft_objs)
+
+        #Get metadata (on DFT grid)
+        if get_meta:
+            self.save_metadata(sim, is_vac, data_dir, vols=vols, dft_objs=dft_objs)
+
+        #Reset meep
+        sim.reset_meep()
+
+############################################
+############################################
+
+############################################
+####	Steady State ####
+############################################
+
+    def get_stop_condition(self, sim, pol, is_vac, max_time):
+        #Stop at fixed time (relative to current, e.g., if resumed) or at steady state
+        if self.msim.steady_tol is None:
+            return max_time - sim.meep_time()
+        else:
+            return self.get_steady_state_func(pol, is_vac, max_time, sim.meep_time())
+
+    def get_steady_state_func(self, pol, is_vac, max_time, start_time=0.):
+
+        #Observation line and components to track
+        vol = self.msim.get_observation_volume(is_vac)
+        comps = [self.msim.get_source_component(p) for p in pol]
+
+        #Previous (demodulated) field and time of next check (first period after start,
+        #e.g., if resumed)
+        next_time = (np.floor(start_time / self.msim.wave) + 1.) * self.msim.wave
+        state = {'fld': None, 'next_time': next_time}
+
+        def stop_func(sim):
+
+            #Stop at maximum run time
+            if sim.meep_time() >= max_time:
+                return True
+
+            #Only check once per optical period
+            if sim.meep_time() < state['next_time']:
+                return False
+            state['next_time'] += self.msim.wave
+
+            #Get fields (all processors gather)
+            fld = np.concatenate([np.atleast_1d(sim.get_array(vol=vol, component=comp)).ravel() \
+                for comp in comps])
+
+            #Remove carrier (checks don't land on same phase, as period isn't multiple of dt)
+            fld = self.demodulate(fld, sim.meep_time())
+
+            #Compare to previous period
+            is_steady = False
+            if state['fld'] is not None:
+                is_steady = self.get_steady_error(fld, state['fld']) < self.msim.steady_tol
+
+            #Store
+            state['fld'] = fld
+
+            #Print
+            if is_steady:
+                self.logger.write(f'Reached steady state at {sim.meep_time():.2f}', \
+                    is_time=False)
+
+            return is_steady
+
+        return stop_func
+
+    def demodulate(self, fld, run_time):
+        #Phasor of time-harmonic field exp(-i*w*t)
+        return fld * np.exp(1j*2.*np.pi*self.msim.fcen*run_time)
+
+    def get_steady_error(self, fld, prev_fld):
+        #Relative change of demodulated field
+        return np.linalg.norm(fld - prev_fld) / max(np.linalg.norm(fld), 1e-30)
+
+############################################
+############################################
+
+############################################
+####	Progress ####
+############################################
+
+    def get_progress_funcs(self, sim, max_time):
+        #Turned off
+        if self.progress_dt is None:
+            return []
+
+        #Grid points updated each step
+        n_points = np.prod([max(l*self.msim.resolution, 1) for l in sim.cell_size])
+        dt = self.msim.courant / self.msim.resolution
+
+        #Wall and sim time of previous report
+        state = {'wall':time.perf_counter(), 'sim':sim.meep_time()}
+
+        def report(sim):
+            #Rates since last report
+            wall, now = time.perf_counter(), sim.meep_time()
+            steps_per_sec = (now - state['sim']) / dt / max(wall - state['wall'], 1e-12)
+            state.update({'wall':wall, 'sim':now})
+
+            #Remaining time
+            eta = max(max_time - now, 0) / dt / max(steps_per_sec, 1e-12)
+            prog = {'run':self.logger.span_run, 'sim_time':now, 'run_time':max_time, \
+                'percent':100*now/max_time, 'steps_per_sec':steps_per_sec, \
+                'pixel_updates_per_sec':steps_per_sec*n_points, 'eta':eta, \
+                'timestamp':time.time()}
+
+            #Print and save (in session directory, even if vacuum is cached)
+            self.logger.write(f'{prog["run"]}: t = {now:.1f} ({prog["percent"]:.0f}%), ' + \
+                f'{steps_per_sec:.1f} steps/s, {prog["pixel_updates_per_sec"]:.2e} ' + \
+                f'pixels/s, ETA {eta:.0f} [s]', is_time=False)
+            self.logger.save_progress(prog)
+
+        #Report every progress_dt periods
+        return [mp.at_every(self.progress_dt*self.msim.wave, report)]
+
+############################################
+############################################
+
+############################################
+####	Checkpointing ####
+############################################
+
+    def get_checkpoint_dir(self, data_dir, pol, is_vac):
+        return f'{data_dir}/checkpoint_{["", "vac_"][int(is_vac)]}{pol}'
+
+    def get_checkpoint_funcs(self, ckpt_dir, end_time):
+        #Turned off
+        if self.checkpoint_dt is None:
+            return []
+
+        def save_func(sim):
+            #Skip at end of run (at_every also fires there; checkpoint would be removed)
+            if sim.meep_time() >= end_time - sim.fields.dt:
+                return
+            self.save_checkpoint(sim, ckpt_dir)
+
+        #Save checkpoint every checkpoint_dt periods
+        return [mp.at_every(self.checkpoint_dt*self.msim.wave, save_func)]
+
+    def save_checkpoint(self, sim, ckpt_dir):
+
+        #Dump to temporary directory so latest checkpoint is never partially written
+        tmp_dir = f'{ckpt_dir}_tmp'
+        sim.dump(tmp_dir, dump_structure=True, dump_fields=True)
+
+        #Wait
+        semp.group_barrier()
+
+        #Save time and replace previous checkpoint
+        if semp.group_zero_rank:
+            np.save(f'{tmp_dir}/time', sim.meep_time())
+            if os.path.exists(ckpt_dir):
+                shutil.rmtree(ckpt_dir)
+            os.rename(tmp_dir, ckpt_dir)
+
+        #Wait
+        semp.group_barrier()
+
+        #Print
+        self.logger.write(f'Saved checkpoint at {sim.meep_time():.2f}', is_time=False)
+
+    def has_checkpoint(self, ckpt_dir):
+        #Resuming and checkpoint exists (decided by zero rank)
+        if not self.resume:
+            return False
+        return semp.group_bcast(os.path.exists(f'{ckpt_dir}/time.npy'))
+
+    def load_checkpoint(self, sim, ckpt_dir):
+
+        #Return if not resuming
+        if not self.has_checkpoint(ckpt_dir):
+            return
+
+        #Load structure and fields into new simulation (not reused)
+        sim.load(ckpt_dir, load_structure=True, load_fields=True)
+        sim.init_sim()
+
+        #Restore time step
+        ckpt_time = float(np.load(f'{ckpt_dir}/time.npy'))
+        sim.fields.t = int(round(ckpt_time / sim.fields.dt))
+
+        #Print
+        self.logger.write(f'Resumed from checkpoint at {sim.meep_time():.2f}', is_time=False)
+
+    def clean_checkpoint(self, ckpt_dir):
+        #Remove checkpoint after run is finished
+        if semp.group_zero_rank and os.path.exists(ckpt_dir):
+            shutil.rmtree(ckpt_dir)
+
+        #Wait
+        semp.group_barrier()
+
+############################################
+############################################
+
+############################################
+####	Structure Cache ####
+############################################
+
+    def load_structure_cache(self, sim, is_vac):
+
+        #Vacuum structure is trivial; skip if already initialized (e.g., checkpoint)
+        if not self.use_structure_cache or is_vac or sim.structure is not None:
+            return
+
+        #Cache directory keyed by structure parameters
+        cache_dir = f'{semp.structure_cache_dir}/{self.msim.get_structure_key()}'
+
+        #Load if exists (decided by zero rank); structure is read when initialized
+        if semp.group_bcast(os.path.exists(f'{cache_dir}/structure.h5')):
+            sim.load(cache_dir, load_structure=True, load_fields=False)
+            sim.init_sim()
+            self.logger.write(f'Using cached structure: {cache_dir}')
+            return
+
+        #Otherwise initialize
+        sim.init_sim()
+
+        #Dump to temporary directory so cached structure is never partially written
+        #(unique name, as other sessions may be writing same structure)
+        tmp_dir = semp.group_bcast(f'{cache_dir}.tmp-{uuid.uuid4().hex[:8]}')
+        if semp.group_zero_rank:
+            self.util.create_directory(tmp_dir)
+        semp.group_barrier()
+        sim.dump(tmp_dir, dump_structure=True, dump_fields=False)
+        semp.group_barrier()
+
+        #Move into place (fails if another session finished first, then keep theirs)
+        if semp.group_zero_rank:
+            try:
+                os.rename(tmp_dir, cache_dir)
+            except OSError:
+                shutil.rmtree(tmp_dir)
+        semp.group_barrier()
+
+############################################
+############################################
+
+############################################
+####	Vacuum Cache ####
+############################################
+
+    def get_vac_cache(self, pol):
+
+        #Cache directory keyed by vacuum parameters
+        cache_dir = f'{semp.vac_cache_dir}/{self.msim.get_vac_cache_key(pol)}'
+
+        #Check if finished (decided by zero rank)
+        is_cached = semp.group_bcast(os.path.exists(f'{cache_dir}/complete'))
+
+        #Point session to cache
+        for p in pol:
+            self.vac_dirs[p] = cache_dir
+        self.logger.save_vac_dirs(self.vac_dirs)
+
+        #Run in directory of this session (same on restart) and move into cache when done
+        ses_key = hashlib.sha1(os.path.abspath(self.logger.data_dir).encode()).hexdigest()[:8]
+        tmp_dir = f'{cache_dir}.tmp-{ses_key}'
+        if not is_cached and semp.group_zero_rank:
+            self.util.create_directory(tmp_dir)
+        semp.group_barrier()
+
+        return [tmp_dir, cache_dir][int(is_cached)], is_cached
+
+    def finish_vac_cache(self, tmp_dir, pol):
+
+        #Cache directory
+        cache_dir = self.vac_dirs[pol[0]]
+
+        if semp.group_zero_rank:
+
+            #Write marker once all outputs are written
+            with open(f'{tmp_dir}/complete', 'w') as f:
+                f.write(self.logger.data_dir)
+
+            #Move into place (fails if another session finished first, then keep theirs)
+            try:
+                os.rename(tmp_dir, cache_dir)
+            except OSError:
+                shutil.rmtree(tmp_dir)
+
+        #Wait
+        semp.group_barrier()
+
+############################################
+############################################
+
+############################################
+####	Run Memoization ####
+############################################
+
+    def get_run_state(self, data_dir):
+        #Run info
+        info = self.logger.load_run_info(data_dir=data_dir)
+
+        #Modification times of all files in directory (only zero rank)
+        outs = {}
+        if semp.group_zero_rank:
+            for root, dirs, files in os.walk(data_dir):
+                for fn in files:
+                    if fn in ['run_info.pck', 'progress.json']:
+                        continue
+                    fname = f'{root}/{fn}'
+                    outs[os.path.relpath(fname, data_dir)] = os.path.getmtime(fname)
+
+        #Datasets written to single files so far
+        return outs, info, len(self.single_outputs)
+
+    def save_run_record(self, pol, is_vac, data_dir, done_key, old_state):
+        #Skip if not cataloging
+        if not (self.use_catalog or self.reuse_existing):
+            return
+
+        #Files and run info written during run
+        new_outs, new_info = self.get_run_state(data_dir)[:2]
+        old_outs, old_info = old_state[:2]
+        files = [fn for fn, tt in new_outs.items() if old_outs.get(fn) != tt and \
+            os.path.basename(fn) != self.single_file]
+        info = {k: v for k, v in new_info.items() if old_info.get(k) != v}
+
+        #Datasets written to single files during run (file shared with other runs)
+        dsets = sorted(set([(os.path.relpath(fname, data_dir), name) \
+            for fname, name in self.single_outputs[old_state[2]:]]))
+
+        #Return if not zero-rank processor
+        if not semp.group_zero_rank:
+            return
+
+        #Save with session (for rescan) and in catalog
+        record = {'run_key':self.msim.get_run_key(pol, is_vac), 'done_key':done_key, \
+            'files':sorted(files), 'datasets':dsets, 'info':info}
+        name = f'{["", "vac_"][int(is_vac)]}{pol}'
+        self.logger.save_run_info(f'record_{name}', record, data_dir=data_dir)
+        try:
+            semp.utils.Catalog().add_run(data_dir, record)
+        except sqlite3.Error as err:
+            bad_str = self.util.color_string('!*!', self.util.bad_color)
+            print(f'\n{bad_str} Could not record run in catalog: {err} {bad_str}\n')
+
+    def link_existing_run(self, pol, is_vac, get_meta, data_dir, done_key):
+
+        #Find verified run with same parameters (decided by zero rank)
+        src_dir, record = None, None
+        if semp.group_zero_rank:
+            try:
+                runs = semp.utils.Catalog().find_runs(self.msim.get_run_key(pol, is_vac))
+            except sqlite3.Error:
+                runs = []
+            for run_dir, run_record in runs:
+                if self.is_valid_run(run_dir, run_record, get_meta):
+                    src_dir, record = run_dir, run_record
+                    break
+        src_dir, record = semp.group_bcast((src_dir, record))
+
+        #Return if none found
+        if src_dir is None:
+            return False
+
+        #Link outputs into session (unless already here)
+        if semp.group_zero_rank and os.path.abspath(src_dir) != os.path.abspath(data_dir):
+            for fn in record['files']:
+                dst = f'{data_dir}/{fn}'
+                self.util.create_directory(os.path.dirname(dst))
+                if os.path.lexists(dst):
+                    os.remove(dst)
+                os.symlink(os.path.realpath(f'{src_dir}/{fn}'), dst)
+
+            #Link datasets of single files
+            for fn, name in record.get('datasets', []):
+                self.link_single(f'{src_dir}/{fn}', f'{data_dir}/{fn}', name)
+
+            #Copy run info (including finished flag)
+            for k, v in record['info'].items():
+                self.logger.save_run_info(k, v, data_dir=data_dir)
+            self.logger.save_run_info(f'reused_{done_key}', src_dir, data_dir=data_dir)
+        semp.group_barrier()
+
+        #Print
+        self.logger.write(f'Reusing existing run: {src_dir}')
+
+        return True
+
+    def is_valid_run(self, run_dir, record, get_meta):
+        #Still marked finished
+        fname = f'{run_dir}/run_info.pck'
+        if not os.path.exists(fname) or \
+            not pickle.load(open(fname, 'rb')).get(record['done_key']):
+            return False
+
+        #All outputs exist and are not empty
+        for fn in record['files']:
+            if not os.path.exists(f'{run_dir}/{fn}') or \
+                os.path.getsize(f'{run_dir}/{fn}') == 0:
+                return False
+
+        #All datasets exist in single files
+        for fn, name in record.get('datasets', []):
+            if not os.path.exists(f'{run_dir}/{fn}'):
+                return False
+            with h5py.File(f'{run_dir}/{fn}', 'r') as f:
+                if name not in f:
+                    return False
+
+        #Metadata needed by this session was written by that run
+        if get_meta and not any(['coords' in fn for fn in record['files']] + \
+            ['eps' in name for fn, name in record.get('datasets', [])]):
+            return False
+
+        return True
+
+    def link_single(self, src_file, dst_file, name):
+        self.util.create_directory(os.path.dirname(dst_file))
+        with h5py.File(dst_file, 'a', libver='latest') as f:
+
+            #Link to dataset in other file
+            if name in f:
+                del f[name]
+            f[name] = h5py.ExternalLink(os.path.realpath(src_file), name)
+
+            #Run time of metadata
+            with h5py.File(src_file, 'r') as g:
+                if 'time_ext' in g.attrs and 'time_ext' not in f.attrs:
+                    f.attrs['time_ext'] = g.attrs['time_ext']
+
+############################################
+############################################
+
+############################################
+####	Broadband Simulation ####
+############################################
+
+    def run_single_broadband(self, pol, is_vac, get_meta, data_dir):
+
+        #Build to simulation (with pulsed source)
+        with self.logger.span('build'):
+            sim = self.msim.build_sim(pol=pol, is_vac=is_vac)
+
+        #Load or store initialized structure
+        with self.logger.span('init'):
+            self.load_structure_cache(sim, is_vac)
+            if sim.structure is None:
+                sim.init_sim()
+        self.logger.record_chunks(sim)
+
+        #Get fields to output
+        fld_names = self.get_field_names(pol)
+        comps = [self.get_field_component(fn) for fn in fld_names]
+
+        #Output regions (default to entire cell)
+        vols = self.msim.get_output_volumes(is_vac)
+        if vols is None:
+            vols = [mp.Volume(center=mp.Vector3(), size=sim.cell_size)]
+
+        #Add DFT monitors over output regions at all wavelengths
+        dft_objs = [sim.add_dft_fields(comps, self.msim.fcens, where=vol) for vol in vols]
+
+        #Progress reports (pulse ends at start + 2*cutoff*width)
+        src = sim.sources[0].src
+        prog_funcs = self.get_progress_funcs(sim, \
+            self.msim.run_time + src.start_time + 2*src.cutoff*src.width)
+
+        #Run sim until pulse has passed through
+        with self.logger.span('stepping'):
+            sim.run(*prog_funcs, until_after_sources=self.msim.run_time)
+
+        #Loop over wavelengths and write each to own directory
+        for iw, wave in enumerate(self.msim.waves):
+
+            #Directory for this wavelength
+            wave_dir = self.logger.get_wave_dir(wave, data_dir=data_dir)
+            if semp.group_zero_rank:
+                self.util.create_directory(wave_dir)
+
+            #Save DFT fields
+            self.save_fields(sim, fld_names, is_vac, wave_dir, vols, \
+                dft_objs=dft_objs, ifreq=iw)
+
+            #Get metadata (on DFT grid)
+            if get_meta:
+                self.save_metadata(sim, is_vac, wave_dir, vols=vols, dft_objs=dft_objs)
+
+        #Wait
+        semp.group_barrier()
+
+        #Reset meep
+        sim.reset_meep()
+
+############################################
+############################################
+
+############################################
+####	Shared Functions ####
+############################################
+
+    def get_field_names(self, pol):
+        #Get meep names of fields to output
+        if self.save_all:
+            fld_dict = {'s':['efield_z','hfield_x','hfield_y'], \
+                'p':['hfield_z','efield_x','efield_y']}
+        else:
+            fld_dict = {'s':['efield_z','hfield_y'], \
+                'p':['hfield_z','efield_y']}
+
+        #Combine for joint polarization ('sp')
+        fld_names = []
+        for p in pol:
+            fld_names += fld_dict[p]
+
+        return fld_names
+
+    def get_field_file_name(self, fld_name):
+        #e.g., efield_z -> ez
+        return f'{fld_name[0]}{fld_name[-1]}'
+
+    def get_field_component(self, fld_name):
+        #e.g., efield_z -> mp.Ez
+        return getattr(mp, self.get_field_file_name(fld_name).capitalize())
+
+    def save_fields(self, sim, fld_names, is_vac, data_dir, vols, dft_objs=None, ifreq=0):
+
+        #Full cell if no regions
+        if vols is None:
+            vols = [None]
+
+        #Time extension to match meep's filenames
+        run_time = sim.meep_time()
+
+        #Vacuum prefix
+        vac_ext = ['', 'vac-'][int(is_vac)]
+
+        #Loop over field components
+        for fn in fld_names:
+
+            #Field name and component
+            name = self.get_field_file_name(fn)
+            comp = self.get_field_component(fn)
+
+            #Get field in each region (all processors gather)
+            with self.logger.span('field_output'):
+                if dft_objs is None:
+                    flds = [sim.get_array(vol=vol, component=comp) for vol in vols]
+                else:
+                    flds = [sim.get_dft_array(dft, comp, ifreq) for dft in dft_objs]
+
+            #Save in same format as meep's complex field output (or single file)
+            if semp.group_zero_rank:
+
+                #Separate output per volume
+                if self.output_type == 'volumes':
+                    for iv, fld in enumerate(flds):
+                        self.write_field(data_dir, f'{vac_ext}{name}_vol{iv}', name, \
+                            fld, run_time)
+
+                #Stack observation planes into single output
+                else:
+                    fld = [flds[0], np.array(flds)][int(self.output_type == 'planes')]
+                    self.write_field(data_dir, f'{vac_ext}{name}', name, fld, run_time)
+
+            #Cleanup
+            del flds
+
+    def write_field(self, data_dir, base_name, name, fld, run_time):
+        #Dataset in single file
+        if self.output_format == 'single':
+            self.write_single(data_dir, base_name, fld, {'time':run_time})
+            return
+
+        #Separate file with real and imaginary parts
+        with self.logger.span('hdf5_write'):
+            with h5py.File(f'{data_dir}/{base_name}-{run_time:09.2f}.h5', 'w') as f:
+                f.create_dataset(f'{name}.r', data=fld.real)
+                f.create_dataset(f'{name}.i', data=fld.imag)
+
+    def write_single(self, data_dir, name, data, attrs={}):
+        with self.logger.span('hdf5_write'):
+            #Latest format allows large attributes (coordinates)
+            with h5py.File(f'{data_dir}/{self.single_file}', 'a', libver='latest') as f:
+
+                #Parameters of run
+                if 'parameters' not in f.attrs:
+                    f.attrs['parameters'] = repr(self.params)
+
+                #Replace previous output
+                if name in f:
+                    del f[name]
+                self.single_outputs.append((f.filename, name))
+
+                #Chunk by x-rows so single rows are read without reading whole array
+                chunks = None
+                if data.ndim > 1:
+                    chunks = (1,) + data.shape[1:]
+                elif self.compression is not None:
+                    chunks = True
+
+                #Save (complex stored natively)
+                dset = f.create_dataset(name, data=data, chunks=chunks, \
+                    compression=self.compression)
+                for k, v in attrs.items():
+                    dset.attrs[k] = v
+
+    def save_metadata(self, sim, is_vac, data_dir, vols=None, dft_objs=None):
+
+        #Full cell if no regions
+        if vols is None:
+            vols = [None]
+        if dft_objs is None:
+            dft_objs = [None]*len(vols)
+
+        #Get dielectric and coordinates (on DFT grid if supplied) in each region
+        eps, coords = [], []
+        with self.logger.span('metadata'):
+            for vol, dft_obj in zip(vols, dft_objs):
+                coords.append(sim.get_array_metadata(vol=vol, dft_cell=dft_obj)[:3])
+                eps.append(sim.get_array(component=mp.Dielectric, vol=vol))
+
+                #Sample dielectric on DFT grid (may differ from Yee grid)
+                if dft_obj is not None:
+                    eps[-1] = self.get_dft_dielectric(sim, vol, eps[-1], coords[-1])
+
+        #Get run time
+        run_time = sim.meep_time()
+
+        #Save metadata
+        if semp.group_zero_rank:
+
+            #Prefix
+            pre = f"{data_dir}/{['', 'vac-'][int(is_vac)]}"
+            pst = f"-{run_time:09.2f}"
+
+            #Separate file per volume
+            if self.output_type == 'volumes':
+                exts = [f'_vol{iv}' for iv in range(len(vols))]
+
+            #Stack observation planes
+            elif self.output_type == 'planes':
+                exts = ['']
+                eps = [np.array(eps)]
+                coords = [[np.concatenate([c[0] for c in coords]), coords[0][1], coords[0][2]]]
+
+            else:
+                exts = ['']
+
+            #Loop through regions
+            for ext, ep, (x,y,z) in zip(exts, eps, coords):
+
+                #Dielectric with coordinates as attributes in single file
+                if self.output_format == 'single':
+                    self.write_single(data_dir, f"{['', 'vac-'][int(is_vac)]}eps{ext}", \
+                        ep, {'xx':x, 'yy':y, 'zz':z, 'time':run_time})
+                    continue
+
+                with self.logger.span('hdf5_write'):
+
+                    #Save dielectric
+                    with h5py.File(f'{pre}eps{ext}{pst}.h5', 'w') as f:
+                        f.create_dataset('dielectric', data=ep)
+
+                    #Save coordinates
+                    with h5py.File(f'{pre}coords{ext}{pst}.h5', 'w') as f:
+                        f.create_dataset('xx', data=x)
+                        f.create_dataset('yy', data=y)
+                        f.create_dataset('zz', data=z)
+
+            #Save run time
+            if self.output_format == 'single':
+                with h5py.File(f'{data_dir}/{self.single_file}', 'a', libver='latest') as f:
+                    f.attrs['time_ext'] = run_time
+            else:
+                np.save(f'{data_dir}/time_ext', run_time)
+
+        #Wait
+        semp.group_barrier()
+
+        #Cleanup
+        del eps, coords
+
+    def get_dft_dielectric(self, sim, vol, eps, coords):
+        #Coordinates of dielectric on Yee grid
+        yee = sim.get_array_metadata(vol=vol)[:3]
+
+        #Nearest Yee point to each DFT coordinate, along axes kept in array
+        iax = 0
+        for yc, cc in zip(yee, coords):
+            yc, cc = np.atleast_1d(yc), np.atleast_1d(cc)
+            if yc.size <= 1:
+                continue
+            inds = np.clip(np.searchsorted(yc, cc), 1, yc.size - 1)
+            inds -= (cc - yc[inds-1] < yc[inds] - cc).astype(int)
+
+            #Drop axis if DFT grid has single point (as fields do)
+            if cc.size > 1:
+                eps = np.take(eps, inds, axis=iax)
+                iax += 1
+            else:
+                eps = np.take(eps, inds[0], axis=iax)
+
+        return eps
+
+############################################
+############################################
+
 ############################################
 ####	Movie Simulation ####
 ############################################
@@ -211,11 +1213,19 @@ class Propagator(object):
         png_func = mp.at_every(self.msim.save_dt, \
             mp.output_png(self.msim.src_comp, png_opts, rm_h5=True))
 
+        #Checkpointing
+        ckpt_dir = self.get_checkpoint_dir(self.logger.data_dir, 'movie', is_vac)
+        self.load_checkpoint(sim, ckpt_dir)
+
         #Output function to save data
-        out_funcs = [eps_func, h5_func, png_func]
+        out_funcs = [eps_func, h5_func, png_func] + self.get_checkpoint_funcs(ckpt_dir, \
+            self.msim.run_time)
 
         #Run sim
-        sim.run(*out_funcs, until=self.msim.run_time)
+        sim.run(*out_funcs, until=self.msim.run_time - sim.meep_time())
+
+        #Remove checkpoint
+        self.clean_checkpoint(ckpt_dir)
 
         #Reset sim
         sim.reset_meep()
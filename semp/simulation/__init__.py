@@ -13,3 +13,4 @@ License: Refer to $pkg_home_dir/LICENSE
 from semp.simulation.meep_sim import Meep_Sim
 from semp.simulation.geometry_2D import Geometry_2D
 from semp.simulation.geometry_3D import Geometry_3D
+from semp.simulation.chunk_layout import Chunk_Layout
@@ -0,0 +1,175 @@
+"""
+chunk_layout.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Class to build a chunk layout that balances the cost of time
+    stepping (dispersive materials, absorbing boundaries) across processes
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import semp
+import numpy as np
+import meep as mp
+
+class Chunk_Layout(object):
+
+    ### HARDWIRED ###
+    cost_res = [4, 2]       # Samples per micron of cost map [2D, 3D]
+    max_samples = 100000    # Maximum samples of cost map (resolution lowered for large cells)
+    boundary_cost = 1.      # Extra cost of PML / absorber pixel (auxiliary fields)
+
+    def __init__(self, parent):
+        self.util = semp.utils.Utilities()
+        self.parent = parent        # .Meep_Sim
+        self.geo = parent.geo
+
+############################################
+####	Main Function ####
+############################################
+
+    def get_layout(self, n_procs):
+        #Cost of each sample in cell
+        self.build_cost_map()
+
+        #Recursively bisect cell into equal cost pieces
+        self.next_proc = 0
+        lims = [(-l/2, l/2) for l in self.lens]
+        data = self.bisect(lims, n_procs)
+
+        return mp.BinaryPartition(data=data)
+
+############################################
+############################################
+
+############################################
+####	Cost Map ####
+############################################
+
+    def build_cost_map(self):
+        #Cell dimensions (only those with extent)
+        self.lens = [l for l in [self.geo.lx, self.geo.ly, self.geo.lz] if l > 0]
+        self.dirs = [mp.X, mp.Y, mp.Z][:len(self.lens)]
+
+        #Sample centers (each is tested against every object, so limit number)
+        res = self.cost_res[int(len(self.lens) == 3)]
+        res = min(res, (self.max_samples / np.prod(self.lens))**(1./len(self.lens)))
+        nums = [max(int(l*res), 2) for l in self.lens]
+        self.axes = [(np.arange(n) + 0.5) / n * l - l/2 for n, l in zip(nums, self.lens)]
+        grids = np.meshgrid(*self.axes, indexing='ij')
+
+        #Base cost of time stepping
+        self.cost = np.ones(grids[0].shape)
+
+        #Dispersive materials (cost per Lorentzian pole, from estimator calibration)
+        pole_cost = semp.estimator.load_calibration()['time_per_pole']
+        for ob in self.parent.get_geometry(False):
+            n_poles = len(getattr(ob.material, 'E_susceptibilities', [])) + \
+                len(getattr(ob.material, 'H_susceptibilities', []))
+            #Later objects take precedence (as in meep)
+            self.cost[self.get_inside(ob, grids)] = 1. + pole_cost*n_poles
+
+        #Absorbing boundaries
+        self.cost[self.get_boundary_mask(grids)] += self.boundary_cost
+
+    def get_inside(self, ob, grids):
+        #Samples of cell
+        pts = np.stack([g.ravel() for g in grids], axis=-1)
+
+        #Only test samples within bounding box of object
+        cand = np.ones(len(pts), dtype=bool)
+        bounds = self.get_bounds(ob)
+        if bounds is not None:
+            for i in range(min(pts.shape[-1], 2)):
+                cand &= (pts[:,i] >= bounds[0][i]) & (pts[:,i] <= bounds[1][i])
+
+        #Samples inside geometric object
+        inside = np.zeros(len(pts), dtype=bool)
+        inside[cand] = [mp.is_point_in_object(mp.Vector3(*pt), ob) for pt in pts[cand]]
+        return inside.reshape(grids[0].shape)
+
+    def get_bounds(self, ob):
+        #Box in x and y containing object (None if not known)
+        if isinstance(ob, mp.Prism) and ob.axis == mp.Vector3(z=1):
+            verts = np.array([[v.x, v.y] for v in ob.vertices])
+            return verts.min(0), verts.max(0)
+
+        #Unrotated block (or ellipsoid)
+        if isinstance(ob, mp.Block) and ob.e1 == mp.Vector3(x=1) and \
+            ob.e2 == mp.Vector3(y=1):
+            cen, sze = np.array([ob.center.x, ob.center.y]), np.array([ob.size.x, ob.size.y])
+            return cen - sze/2, cen + sze/2
+
+        return None
+
+    def get_boundary_mask(self, grids):
+        #PML in x (both sides)
+        mask = np.abs(grids[0]) > self.geo.lx/2 - self.parent.pmlx
+
+        #Y boundary (edge only on low side)
+        if len(grids) > 1:
+            if self.geo.is_edge:
+                mask |= grids[1] < -self.geo.ly/2 + self.parent.pmly
+            else:
+                mask |= np.abs(grids[1]) > self.geo.ly/2 - self.parent.pmly
+
+        #Z boundary (3D)
+        if len(grids) > 2:
+            mask |= np.abs(grids[2]) > self.geo.lz/2 - self.parent.pmlz
+
+        return mask
+
+############################################
+############################################
+
+############################################
+####	Bisection ####
+############################################
+
+    def bisect(self, lims, n_procs):
+        #Single process owns region
+        if n_procs == 1:
+            self.next_proc += 1
+            return self.next_proc - 1
+
+        #Split along longest dimension
+        idir = np.argmax([hi - lo for lo, hi in lims])
+
+        #Processes on each side
+        n_left = n_procs // 2
+
+        #Cost along split direction within region
+        sub = self.get_region_cost(lims)
+        prof = sub.sum(axis=tuple([i for i in range(sub.ndim) if i != idir]))
+        axis = self.axes[idir][self.get_region_inds(lims)[idir]]
+
+        #Position where cumulative cost matches share of processes
+        if len(axis) < 2:
+            pos = sum(lims[idir]) / 2
+        else:
+            cum = np.cumsum(prof) / prof.sum()
+            ind = np.clip(np.searchsorted(cum, n_left/n_procs), 0, len(axis) - 2)
+            pos = (axis[ind] + axis[ind+1]) / 2
+
+        #Recurse on each side
+        left = [lm if i != idir else (lm[0], pos) for i, lm in enumerate(lims)]
+        rght = [lm if i != idir else (pos, lm[1]) for i, lm in enumerate(lims)]
+
+        return [(self.dirs[idir], pos), self.bisect(left, n_left), \
+            self.bisect(rght, n_procs - n_left)]
+
+    def get_region_inds(self, lims):
+        #Samples inside region along each dimension
+        return [(ax >= lo) & (ax < hi) for ax, (lo, hi) in zip(self.axes, lims)]
+
+    def get_region_cost(self, lims):
+        sub = self.cost
+        for i, inds in enumerate(self.get_region_inds(lims)):
+            sub = np.compress(inds, sub, axis=i)
+        return sub
+
+############################################
+############################################
@@ -14,6 +14,7 @@ import semp
 import numpy as np
 import meep as mp
 import meep.materials as mat_lib
+import hashlib
 
 class Meep_Sim(object):
 
@@ -41,13 +42,13 @@ class Meep_Sim(object):
         if self.is_sommerfeld:
             self.apply_sommerfeld()
 
-        #Calculate central frequency and width
-        self.fcen = 1./self.wave
-
         #Source offset
         self.src_offset = mp.Vector3(y=self.source_offset_y, \
             z=self.source_offset_z) * self.util.m2mu
 
+        #Calculate central frequency and width
+        self.set_frequencies()
+
         #Convert timescales
         self.run_time = self.n_periods*self.wave
         if self.prop.save_nt is None:
@@ -75,6 +76,51 @@ class Meep_Sim(object):
             if self.pad_all is not None:
                 setattr(self, f'pad{comp}', self.pad_all)
 
+    def set_frequencies(self):
+        #Broadband run?
+        self.is_broadband = self.waves is not None
+
+        if self.is_broadband:
+            #Frequencies to extract with DFT
+            self.waves = np.atleast_1d(self.waves).astype(float)
+            self.fcens = 1./self.waves
+
+            #Pulse center and width (give single wavelength some width)
+            self.fcen = self.fcens.mean()
+            self.fwidth = max(2.*np.ptp(self.fcens), 0.2*self.fcen)
+
+            #Central wavelength sets timescales
+            self.wave = 1./self.fcen
+
+            #Amplitude functions are only valid at a single frequency
+            if self.is_diverging or self.src_offset.norm() != 0:
+                bad_str = self.util.color_string('!*!', self.util.bad_color)
+                print(f'\n{bad_str} Broadband only supports on-axis plane waves {bad_str}\n')
+                import sys; sys.exit(0)
+
+            #Analytic vacuum is only derived for CW source
+            if self.prop.analytic_vac:
+                bad_str = self.util.color_string('!*!', self.util.bad_color)
+                print(f'\n{bad_str} Broadband requires simulated vacuum {bad_str}\n')
+                import sys; sys.exit(0)
+
+        else:
+            self.fcen = 1./self.wave
+            self.fcens = np.array([self.fcen])
+
+        #Frequency domain solver is single frequency and outputs final fields
+        if self.prop.engine == 'frequency_domain' and \
+            (self.is_broadband or self.dft_periods is not None):
+            bad_str = self.util.color_string('!*!', self.util.bad_color)
+            print(f'\n{bad_str} Frequency domain engine requires CW output {bad_str}\n')
+            import sys; sys.exit(0)
+
+        #Analytic vacuum is only derived for end-of-run snapshot
+        if self.prop.analytic_vac and self.dft_periods is not None:
+            bad_str = self.util.color_string('!*!', self.util.bad_color)
+            print(f'\n{bad_str} DFT phasors require simulated vacuum {bad_str}\n')
+            import sys; sys.exit(0)
+
     def apply_sommerfeld(self):
         #Sommerfeld is infinitely thin PEC
         self.wafer_material = 'metal'
@@ -121,10 +167,14 @@ class Meep_Sim(object):
 ####	Build Simulation ####
 ############################################
 
-    def build_sim(self, pol='s', is_vac=False):
+    def build_sim(self, pol='s', is_vac=False, engine=None):
         """X is aligned with propagation distance, Y is perpendicular to gap/edge,
            Z is parallel to gap/edge"""
 
+        #Solver engine
+        if engine is None:
+            engine = self.prop.engine
+
         #K-point
         k_point = mp.Vector3()
 
@@ -143,14 +193,33 @@ class Meep_Sim(object):
         #Geometry
         geometry = self.get_geometry(is_vac)
 
+        #Division of cell between processes
+        chunk_layout = self.get_chunk_layout(is_vac)
+
         #Build simulation
-        sim = mp.Simulation(split_chunks_evenly=False, force_complex_fields=True,
-            ensure_periodicity=False, resolution=self.resolution, Courant=self.courant,
-            cell_size=cell_size, boundary_layers=pml_layers, sources=sources,
-            geometry=geometry, symmetries=symmetries, k_point=k_point)
+        sim = mp.Simulation(split_chunks_evenly=self.split_chunks_evenly,
+            force_complex_fields=True, ensure_periodicity=False,
+            resolution=self.resolution, Courant=self.courant, cell_size=cell_size,
+            boundary_layers=pml_layers, sources=sources, geometry=geometry,
+            symmetries=symmetries, k_point=k_point, chunk_layout=chunk_layout)
+
+        #Frequency domain solver needs initialized fields
+        if engine == 'frequency_domain':
+            self.check_frequency_domain(geometry)
+            sim.init_sim()
 
         return sim
 
+    def check_frequency_domain(self, geometry):
+        #Frequency domain solver does not support dispersive materials
+        for ob in geometry:
+            if len(getattr(ob.material, 'E_susceptibilities', [])) > 0 or \
+                len(getattr(ob.material, 'H_susceptibilities', [])) > 0:
+                bad_str = self.util.color_string('!*!', self.util.bad_color)
+                print(f'\n{bad_str} Frequency domain engine does not support ' + \
+                    f'dispersive materials {bad_str}\n')
+                import sys; sys.exit(0)
+
 ############################################
 ############################################
 
@@ -200,19 +269,20 @@ class Meep_Sim(object):
         #Get source functions
         sim_src, amp_func = self.get_source_function()
 
-        #Get source component
-        src_comp = getattr(mp, {'s': 'Ez', 'p': 'Hz'}[pol])
-
-        #Build source   #TODO: add gaussian beam source option
-        sources = [mp.Source(sim_src, component=src_comp, center=src_pt, \
-            size=mp.Vector3(y=src_sze_y, z=src_sze_z), amp_func=amp_func)]
+        #Build source for each polarization ('sp' is joint)   #TODO: add gaussian beam source option
+        sources = [mp.Source(sim_src, component=self.get_source_component(p), \
+            center=src_pt, size=mp.Vector3(y=src_sze_y, z=src_sze_z), amp_func=amp_func) \
+            for p in pol]
 
         return sources
 
     def get_source_function(self):
 
-        #Get source dependent
-        sim_src = mp.ContinuousSource(self.fcen, is_integrated=True)
+        #Get source dependent (pulse for broadband)
+        if self.is_broadband:
+            sim_src = mp.GaussianSource(self.fcen, fwidth=self.fwidth, is_integrated=True)
+        else:
+            sim_src = mp.ContinuousSource(self.fcen, is_integrated=True)
 
         #For amp func
         kk = 2.*np.pi*self.fcen
@@ -234,12 +304,241 @@ class Meep_Sim(object):
 
         return sim_src, amp_func
 
+    def get_source_component(self, pol):
+        return getattr(mp, {'s': 'Ez', 'p': 'Hz'}[pol])
+
+    def get_observation_volume(self, is_vac, obs_distance=0):
+        #Center at distance below bottom of wafer
+        obs_cen = mp.Vector3(x=self.geo.wafer_thick/2 + obs_distance)
+
+        #Point for vacuum, otherwise extends across region kept by analyzer
+        if is_vac:
+            obs_sze = mp.Vector3()
+        else:
+            obs_sze = mp.Vector3(y=self.geo.ly - 2*self.geo.padpmly, \
+                z=max(self.geo.lz - 2*self.pmlz, 0))
+
+        return mp.Volume(center=obs_cen, size=obs_sze)
+
+    def get_nonpml_volume(self, is_vac):
+        #Region kept by the analyzer (excludes pad in y)
+        nonpml_sze = mp.Vector3(self.geo.lx - 2*self.pmlx)
+        if not is_vac:
+            nonpml_sze.y = self.geo.ly - 2*self.geo.padpmly
+            nonpml_sze.z = max(self.geo.lz - 2*self.pmlz, 0)
+
+        return mp.Volume(center=mp.Vector3(), size=nonpml_sze)
+
+    def get_output_volumes(self, is_vac):
+        #Full cell
+        if self.prop.output_type == 'full':
+            return None
+
+        #Non-PML region
+        if self.prop.output_type == 'nonpml':
+            return [self.get_nonpml_volume(is_vac)]
+
+        #Observation planes
+        if self.prop.output_type == 'planes':
+            return [self.get_observation_volume(is_vac, obs_distance=obs) \
+                for obs in self.prop.output_region]
+
+        #Explicit volumes (only x extent for vacuum)
+        vols = []
+        for reg in self.prop.output_region:
+            vol = self.get_region_volume(reg)
+            if is_vac:
+                vol = mp.Volume(center=mp.Vector3(vol.center.x), size=mp.Vector3(vol.size.x))
+            vols.append(vol)
+
+        return vols
+
+    def get_region_volume(self, reg):
+        #Already built
+        if isinstance(reg, mp.Volume):
+            return reg
+
+        #Center and size given as sequences in parameters
+        center, size = [v if isinstance(v, mp.Vector3) else mp.Vector3(*v) for v in reg]
+
+        return mp.Volume(center=center, size=size)
+
     def get_geometry(self, is_vac):
         if is_vac:
             return []
         else:
             return self.geo.get_geometry()
 
+    def get_chunk_layout(self, is_vac):
+        #Meep's default split (also for vacuum, single process, or mirror symmetry)
+        if self.chunk_layout != 'cost' or is_vac or semp.group_size == 1 or \
+            self.geo.has_y_symm:
+            return None
+
+        #Cost balanced layout (computed once)
+        if not hasattr(self, 'cost_layout'):
+            self.cost_layout = semp.simulation.Chunk_Layout(self).get_layout(semp.group_size)
+
+        return self.cost_layout
+
+############################################
+############################################
+
+############################################
+####	Analytic Vacuum ####
+############################################
+
+    def get_numerical_wavenumber(self):
+        #Wavenumber including Yee lattice numerical dispersion
+        dx = 1./self.resolution
+        dt = self.courant*dx
+        ww = 2.*np.pi*self.fcen
+        return 2./dx * np.arcsin(np.sin(ww*dt/2.) / self.courant)
+
+    def get_analytic_vacuum(self, comp, xx, run_time):
+        """Field of discretized planar source in vacuum at observation points xx,
+           matching Meep output at end of run (interpolated to centered grid)"""
+
+        #Lowercase
+        comp = comp.lower()
+
+        #Transverse components are zero for normal incidence
+        if comp in ['ex', 'hx']:
+            return np.zeros_like(xx) + 0j
+
+        #Discretization
+        dx = 1./self.resolution
+        dt = self.courant*dx
+        ww = 2.*np.pi*self.fcen
+        kk = self.get_numerical_wavenumber()
+
+        #Amplitude of unit current sheet on Yee lattice
+        amp = -1./(2.*np.cos(kk*dx/2.))
+
+        #Amplitude from source function evaluated at the (point) vacuum source
+        sim_src, amp_func = self.get_source_function()
+        if amp_func is not None:
+            amp *= amp_func(mp.Vector3(x=self.geo.source_x))
+
+        #Plane wave at end time
+        fld = amp * np.exp(1j*kk*(xx - self.geo.source_x)) * np.exp(-1j*ww*run_time)
+
+        #Fields on integer grid are averaged to pixel centers
+        if comp in ['ez', 'ey']:
+            fld *= np.cos(kk*dx/2.)
+
+        #Magnetic fields are averaged to synchronize in time
+        if comp in ['hy', 'hz']:
+            fld *= np.cos(ww*dt/2.)
+
+        #Wave traveling in +x: Hy = -Ez, Ey = Hz
+        if comp == 'hy':
+            fld *= -1
+
+        return fld
+
+############################################
+############################################
+
+############################################
+####	Vacuum Cache ####
+############################################
+
+    def get_vac_cache_key(self, pol):
+        #Parameters that affect vacuum simulation
+        pms = {
+            'pol':              pol,
+            'save_all':         self.prop.save_all,
+            'lx':               float(self.geo.lx),
+            'pmlx':             float(self.pmlx),
+            'source_x':         float(self.geo.source_x),
+            'resolution':       self.resolution,
+            'courant':          float(self.courant),
+            'run_time':         float(self.run_time),
+            'steady_tol':       self.steady_tol,
+            'dft_periods':      self.dft_periods,
+            'engine':           self.prop.engine,
+            'output_type':      self.prop.output_type,
+            'output_vols':      [(float(vol.center.x), float(vol.size.x)) \
+                for vol in (self.get_output_volumes(True) or [])],
+            'cw_tol':           self.cw_tol,
+            'cw_maxiters':      self.cw_maxiters,
+            'cw_L':             self.cw_L,
+            'fcens':            [float(f) for f in self.fcens],
+            'is_broadband':     self.is_broadband,
+            'is_diverging':     self.is_diverging,
+            'source_distance':  float(self.source_distance),
+            'src_offset':       [float(self.src_offset.y), float(self.src_offset.z)],
+            'meep_version':     mp.__version__,
+        }
+
+        #Hash
+        return hashlib.sha1(repr(sorted(pms.items())).encode()).hexdigest()[:16]
+
+############################################
+############################################
+
+############################################
+####	Run Memoization ####
+############################################
+
+    def get_run_key(self, pol, is_vac):
+        #Vacuum runs keyed by vacuum parameters (and format, as outputs are linked into session)
+        if is_vac:
+            pms = {'vac_key':self.get_vac_cache_key(pol), 'output_format':self.prop.output_format}
+            return hashlib.sha1(repr(sorted(pms.items())).encode()).hexdigest()[:16]
+
+        #Parameters that do not affect the results
+        skip_keys = ['polars', 'split_chunks_evenly', 'chunk_layout']
+
+        #Values after defaults and overrides (e.g., Sommerfeld) are applied
+        pms = {k: repr(getattr(self, k)) for k in \
+            semp.utils.def_params['MEEP_params'].keys() if k not in skip_keys}
+
+        #Run and output settings
+        pms.update({
+            'pol':              pol,
+            'save_all':         self.prop.save_all,
+            'engine':           self.prop.engine,
+            'output_type':      self.prop.output_type,
+            'output_format':    self.prop.output_format,
+            'output_vols':      [(repr(vol.center), repr(vol.size)) \
+                for vol in (self.get_output_volumes(False) or [])],
+            'meep_version':     mp.__version__,
+        })
+
+        #Hash
+        return hashlib.sha1(repr(sorted(pms.items())).encode()).hexdigest()[:16]
+
+############################################
+############################################
+
+############################################
+####	Structure Cache ####
+############################################
+
+    def get_structure_key(self):
+        #Parameters that do not affect the structure
+        skip_keys = ['polars', 'wave', 'waves', 'is_diverging', 'source_distance', \
+            'source_offset_y', 'source_offset_z', 'n_periods', 'steady_tol', \
+            'dft_periods', 'cw_tol', 'cw_maxiters', 'cw_L', 'pml_all', 'pad_all']
+
+        #Values after defaults and overrides (e.g., Sommerfeld) are applied
+        pms = {k: repr(getattr(self, k)) for k in \
+            semp.utils.def_params['MEEP_params'].keys() if k not in skip_keys}
+
+        #Conductivity set from complex epsilon depends on frequency
+        if any([getattr(self, f'{ob}_epsilon') is not None for ob in ['wafer', 'skin', 'oxide']]):
+            pms['fcen'] = repr(float(self.fcen))
+
+        #Symmetry and chunk layout
+        pms['has_y_symm'] = self.geo.has_y_symm
+        pms['mpi_size'] = semp.group_size
+        pms['meep_version'] = mp.__version__
+
+        #Hash
+        return hashlib.sha1(repr(sorted(pms.items())).encode()).hexdigest()[:16]
+
 ############################################
 ############################################
 
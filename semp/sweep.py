@@ -0,0 +1,270 @@
+"""
+sweep.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Class to run a parameter sweep of SEMP simulations on a local pool
+    of MPI workers
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import semp
+import numpy as np
+import os
+import sys
+import time
+import json
+import pickle
+import itertools
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class Sweep(object):
+
+    def __init__(self, meep_params, prop_params, grid, params={}):
+        self.util = semp.utils.Utilities()
+        #Initialize
+        self.initialize(meep_params, prop_params, grid, params)
+
+############################################
+####	Initialization ####
+############################################
+
+    def initialize(self, meep_params, prop_params, grid, params):
+        #Set sweep parameters
+        self.util.set_default_params(self, params, semp.utils.def_params_SWEEP)
+
+        #Base parameters
+        self.meep_params = self.util.deepcopy(meep_params)
+        self.prop_params = self.util.deepcopy(prop_params)
+        self.grid = grid
+
+        #Directories
+        self.sweep_dir = f'{self.base_dir}/{self.session}'
+        self.jobs_dir = f'{self.sweep_dir}/jobs'
+        self.manifest_file = f'{self.sweep_dir}/manifest.json'
+
+        #Number of workers
+        if self.n_cores is None:
+            self.n_cores = os.cpu_count()
+        self.n_workers = max(1, self.n_cores // self.n_procs)
+
+        #Lock for writing manifest
+        self.lock = threading.Lock()
+
+############################################
+############################################
+
+############################################
+####	Main Script ####
+############################################
+
+    def submit(self):
+        #Create directories
+        self.util.create_directory(self.jobs_dir)
+
+        #Build jobs to be run by queue workers
+        self.build_jobs()
+
+        #Print
+        print(f'\n*** Submitted {len(self.jobs)} jobs to {self.sweep_dir} ***\n')
+
+        return [job['name'] for job in self.jobs]
+
+    def run(self):
+        #Create directories
+        self.util.create_directory(self.jobs_dir)
+
+        #Build jobs, ordered longest first
+        self.build_jobs()
+
+        #Print
+        print(f'\n*** Running {len(self.jobs)} jobs on {self.n_workers} workers ' + \
+            f'x {self.n_procs} processes ***\n')
+
+        #Run on pool of workers
+        with ThreadPoolExecutor(max_workers=self.n_workers) as pool:
+            list(pool.map(self.run_job, self.jobs))
+
+        #Print summary
+        n_done = sum([job['status'] == 'done' for job in self.jobs])
+        print(f'\n*** Finished sweep: {n_done} / {len(self.jobs)} jobs done ***\n')
+
+        return self.manifest
+
+############################################
+############################################
+
+############################################
+####	Jobs ####
+############################################
+
+    def build_jobs(self):
+        #Load existing manifest (to skip finished jobs)
+        self.manifest = self.load_manifest()
+
+        #Grid names and values
+        names = list(self.grid.keys())
+        values = [np.atleast_1d(self.grid[k]).tolist() for k in names]
+
+        #Loop over all combinations
+        self.jobs = []
+        for combo in itertools.product(*values):
+
+            #Get parameters for this job
+            meep_params, prop_params = self.get_job_params(dict(zip(names, combo)))
+
+            #Job name
+            name = '__'.join([f'{k}_{v}' for k, v in zip(names, combo)]).replace('/', '-')
+            prop_params['session'] = f'{self.session}/{name}'
+            prop_params['base_dir'] = self.base_dir
+
+            #Save parameters to job file
+            job_file = f'{self.jobs_dir}/{name}.pck'
+            pickle.dump({'MEEP_params':meep_params, 'PROP_params':prop_params}, \
+                open(job_file, 'wb'))
+
+            #Job entry (keep record from previous manifest)
+            job = self.manifest.get(name, {'status':'pending', 'attempts':0})
+            job.update({'name':name, 'job_file':job_file, \
+                'cost':self.estimate_cost(meep_params, prop_params), \
+                'params':{k: v for k, v in zip(names, combo)}})
+            self.manifest[name] = job
+
+            #Add to jobs
+            if self.rerun_done or job['status'] != 'done':
+                job['status'] = 'pending'
+                job['attempts'] = 0
+                self.jobs.append(job)
+
+        #Order longest first
+        self.jobs.sort(key=lambda job: job['cost'], reverse=True)
+
+        #Save manifest
+        self.save_manifest()
+
+    def get_job_params(self, job_pms):
+        #Start with base parameters
+        meep_params = self.util.deepcopy(self.meep_params)
+        prop_params = self.util.deepcopy(self.prop_params)
+
+        #Overwrite with grid values
+        for k, v in job_pms.items():
+            if k in semp.utils.def_params['MEEP_params'].keys():
+                meep_params[k] = v
+            elif k in semp.utils.def_params['PROP_params'].keys():
+                prop_params[k] = v
+            else:
+                bad_str = self.util.color_string('!*!', self.util.bad_color)
+                print(f'\n{bad_str} Unknown Sweep Parameter: {k} {bad_str}\n')
+                sys.exit(0)
+
+        return meep_params, prop_params
+
+    def estimate_cost(self, meep_params, prop_params):
+        #Expected wall time from preflight estimate (without running meep)
+        est = semp.estimate(meep_params, prop_params, nprocs=self.n_procs, verbose=False)
+        return est['wall_time']
+
+    def run_job(self, job):
+
+        #Command to run job
+        cmd = get_job_cmd(job['job_file'], self)
+
+        #Attempt (with retries)
+        while job['status'] != 'done' and job['attempts'] <= self.max_retries:
+
+            #Mark running
+            job['attempts'] += 1
+            job['status'] = 'running'
+            self.save_manifest()
+
+            #Run and log output
+            tik = time.perf_counter()
+            with open(job['job_file'].replace('.pck', '.log'), 'a') as f:
+                out = subprocess.run(cmd, stdout=f, stderr=subprocess.STDOUT)
+
+            #Record result
+            job['returncode'] = out.returncode
+            job['duration'] = time.perf_counter() - tik
+            job['status'] = ['failed', 'done'][int(out.returncode == 0)]
+            self.save_manifest()
+
+            #Print
+            print(f'*** {job["name"]}: {job["status"]} ({job["duration"]:.1f} [s]) ***')
+
+        return job
+
+############################################
+############################################
+
+############################################
+####	Progress ####
+############################################
+
+    def get_progress(self):
+        #Latest progress report of each job (None if not started or not reporting)
+        progress = {}
+        for name in self.load_manifest().keys():
+            fname = f'{self.sweep_dir}/{name}/progress.json'
+            if os.path.exists(fname):
+                with open(fname, 'r') as f:
+                    progress[name] = json.load(f)
+            else:
+                progress[name] = None
+
+        return progress
+
+############################################
+############################################
+
+############################################
+####	Manifest ####
+############################################
+
+    def load_manifest(self):
+        if os.path.exists(self.manifest_file):
+            with open(self.manifest_file, 'r') as f:
+                return json.load(f)
+        return {}
+
+    def save_manifest(self):
+        #Write to temporary file then replace (workers write in parallel)
+        with self.lock:
+            with open(f'{self.manifest_file}.tmp', 'w') as f:
+                json.dump(self.manifest, f, indent=2)
+            os.replace(f'{self.manifest_file}.tmp', self.manifest_file)
+
+############################################
+############################################
+
+############################################
+####	Job Runner ####
+############################################
+
+def get_job_cmd(job_file, pms):
+    #Custom command
+    if pms.job_cmd is not None:
+        return [c.replace('{job_file}', job_file) for c in pms.job_cmd]
+
+    #Run SEMP job (under MPI)
+    cmd = [sys.executable, '-c', f'import semp; semp.sweep.run_job({job_file!r})']
+    if pms.mpirun is not None:
+        cmd = [pms.mpirun, '-np', str(pms.n_procs)] + cmd
+
+    return cmd
+
+def run_job(job_file):
+    #Load parameters
+    params = pickle.load(open(job_file, 'rb'))
+
+    #Run simulation
+    prop = semp.Propagator(params)
+    prop.run_sim()
+
+############################################
+############################################
@@ -10,6 +10,8 @@ Description: __init__ package for the UTILS module
 License: Refer to $pkg_home_dir/LICENSE
 """
 
-from semp.utils.default_parameters import def_params, def_params_ANLZ
+from semp.utils.default_parameters import def_params, def_params_ANLZ, def_params_SWEEP, \
+    def_params_ENSEMBLE
 from semp.utils.logger import Logger
 from semp.utils.utilities import Utilities, util
+from semp.utils.catalog import Catalog
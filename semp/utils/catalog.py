@@ -0,0 +1,274 @@
+"""
+catalog.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Class to index SEMP sessions and their parameters in an SQLite
+    database, so sessions can be found by parameter value
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import semp
+import numpy as np
+import sqlite3
+import hashlib
+import pickle
+import glob
+import h5py
+import json
+import time
+import os
+
+class Catalog(object):
+
+    def __init__(self, db_file=None):
+        self.util = semp.utils.util
+        #Initialize
+        self.initialize(db_file)
+
+############################################
+####	Initialization ####
+############################################
+
+    def initialize(self, db_file):
+        #Database file
+        if db_file is None:
+            db_file = semp.catalog_file
+        self.db_file = db_file
+
+        #Create tables
+        self.util.create_directory(os.path.dirname(os.path.abspath(self.db_file)))
+        with self.connect() as con:
+            con.execute('CREATE TABLE IF NOT EXISTS sessions (data_dir TEXT PRIMARY KEY, ' + \
+                'base_dir TEXT, session TEXT, param_hash TEXT, time_ext REAL, ' + \
+                'run_time REAL, status TEXT, files TEXT, updated REAL)')
+            con.execute('CREATE TABLE IF NOT EXISTS params (data_dir TEXT, ' + \
+                'grp TEXT, name TEXT, value TEXT, num REAL)')
+            con.execute('CREATE INDEX IF NOT EXISTS params_name ON params (name, num, value)')
+            con.execute('CREATE TABLE IF NOT EXISTS runs (run_key TEXT, data_dir TEXT, ' + \
+                'record TEXT, PRIMARY KEY (run_key, data_dir))')
+
+    def connect(self):
+        #Wait on other writers (e.g., runs finishing on other nodes)
+        return sqlite3.connect(self.db_file, timeout=60)
+
+############################################
+############################################
+
+############################################
+####	Adding Sessions ####
+############################################
+
+    def add_session(self, data_dir, params, status='running'):
+        data_dir = os.path.abspath(data_dir)
+
+        #Flatten parameters
+        flat = self.flatten_params(params)
+
+        with self.connect() as con:
+            #Replace old entry (location is where session was written, after defaults)
+            con.execute('DELETE FROM params WHERE data_dir = ?', (data_dir,))
+            con.execute('INSERT OR REPLACE INTO sessions (data_dir, base_dir, session, ' + \
+                'param_hash, status, updated) VALUES (?, ?, ?, ?, ?, ?)', \
+                (data_dir, os.path.dirname(data_dir), os.path.basename(data_dir), \
+                self.get_param_hash(flat), status, time.time()))
+
+            #Parameters
+            con.executemany('INSERT INTO params VALUES (?, ?, ?, ?, ?)', \
+                [(data_dir, grp, name, val, num) for (grp, name), (val, num) in flat.items()])
+
+    def update_session(self, data_dir, **kwargs):
+        data_dir = os.path.abspath(data_dir)
+
+        #Store file list as json
+        if 'files' in kwargs:
+            kwargs['files'] = json.dumps(kwargs['files'])
+        kwargs['updated'] = time.time()
+
+        #Update columns
+        cols = ', '.join([f'{k} = ?' for k in kwargs.keys()])
+        with self.connect() as con:
+            con.execute(f'UPDATE sessions SET {cols} WHERE data_dir = ?', \
+                tuple(kwargs.values()) + (data_dir,))
+
+    def add_run(self, data_dir, record):
+        #Finished simulation run (outputs and run info) keyed by its parameters
+        with self.connect() as con:
+            con.execute('INSERT OR REPLACE INTO runs VALUES (?, ?, ?)', \
+                (record['run_key'], os.path.abspath(data_dir), json.dumps(record)))
+
+    def flatten_params(self, params):
+        #User parameters on top of defaults
+        flat = {}
+        for grp in ['MEEP_params', 'PROP_params']:
+            pms = self.util.deepcopy(semp.utils.def_params[grp])
+            pms.update(params.get(grp, {}))
+            for name, val in pms.items():
+                flat[(grp.split('_')[0], name)] = self.get_value(val)
+        return flat
+
+    def get_value(self, val):
+        #Text representation, and number (if scalar) for comparisons
+        if isinstance(val, (bool, np.bool_, int, float, np.integer, np.floating)):
+            return repr(val), float(val)
+        return repr(val), None
+
+    def get_param_hash(self, flat):
+        return hashlib.sha1(repr(sorted(flat.items())).encode()).hexdigest()[:16]
+
+############################################
+############################################
+
+############################################
+####	Queries ####
+############################################
+
+    def query(self, status=None, rtol=1e-9, **criteria):
+        """Sessions matching parameter values, e.g., query(wave=0.641, taper_angle=5).
+           Returns list of {'base_dir', 'session'} (parameters of Analyzer)."""
+
+        #Build query (one join per criterion)
+        sql = 'SELECT s.base_dir, s.session, s.data_dir, s.status, s.time_ext, ' + \
+            's.run_time, s.param_hash FROM sessions s'
+        names, args, conds = [], [], []
+        for i, (name, val) in enumerate(criteria.items()):
+            txt, num = self.get_value(val)
+            sql += f' JOIN params p{i} ON p{i}.data_dir = s.data_dir AND p{i}.name = ?'
+            names.append(name)
+            if num is not None:
+                conds.append(f'ABS(p{i}.num - ?) <= ? * MAX(ABS(?), 1)')
+                args += [num, rtol, num]
+            else:
+                conds.append(f'p{i}.value = ?')
+                args.append(txt)
+
+        #Filter by status
+        if status is not None:
+            conds.append('s.status = ?')
+            args.append(status)
+
+        if len(conds) > 0:
+            sql += ' WHERE ' + ' AND '.join(conds)
+
+        #Run (join arguments come first)
+        keys = ['base_dir', 'session', 'data_dir', 'status', 'time_ext', 'run_time', \
+            'param_hash']
+        with self.connect() as con:
+            rows = con.execute(sql, names + args).fetchall()
+        return [dict(zip(keys, row)) for row in rows]
+
+    def get_analyzers(self, anlz_params={}, **criteria):
+        #Analyzer for each finished session matching criteria
+        alzs = []
+        for row in self.query(status='done', **criteria):
+            pms = self.util.deepcopy(anlz_params)
+            pms.update({'base_dir':row['base_dir'], 'session':row['session']})
+            alzs.append(semp.analysis.Analyzer(pms))
+        return alzs
+
+    def find_runs(self, run_key):
+        #Directories holding runs with same parameters
+        with self.connect() as con:
+            rows = con.execute('SELECT data_dir, record FROM runs WHERE run_key = ?', \
+                (run_key,)).fetchall()
+        return [(data_dir, json.loads(record)) for data_dir, record in rows]
+
+    def get_params(self, data_dir):
+        #Flattened parameters of session
+        with self.connect() as con:
+            rows = con.execute('SELECT grp, name, value FROM params WHERE data_dir = ?', \
+                (os.path.abspath(data_dir),)).fetchall()
+        return {name: value for grp, name, value in rows}
+
+############################################
+############################################
+
+############################################
+####	Rescan ####
+############################################
+
+    def rescan(self, base_dir=None):
+        #Rebuild catalog from existing directories
+        if base_dir is None:
+            base_dir = semp.results_dir
+
+        #Clear entries under base directory (not siblings sharing its prefix)
+        base_dir = os.path.abspath(base_dir)
+        prefix = (base_dir + os.sep).replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        with self.connect() as con:
+            for tbl in ['params', 'sessions', 'runs']:
+                con.execute(f"DELETE FROM {tbl} WHERE data_dir = ? OR " + \
+                    "data_dir LIKE ? ESCAPE '\\'", (base_dir, prefix + '%'))
+
+        #Every directory with saved parameters is a session
+        n_sess = 0
+        for root, dirs, files in os.walk(base_dir):
+            if 'parameters.pck' not in files:
+                continue
+
+            #Load parameters
+            try:
+                params = pickle.load(open(f'{root}/parameters.pck', 'rb'))
+            except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+                continue
+
+            #Add with saved session location
+            params['PROP_params'] = dict(params.get('PROP_params', {}))
+            params['PROP_params']['base_dir'] = os.path.dirname(root)
+            params['PROP_params']['session'] = os.path.basename(root)
+            self.add_session(root, params, status=self.get_status(root))
+            self.update_session(root, **self.get_file_info(root))
+            n_sess += 1
+
+        #Runs are recorded in each directory's run info (including vacuum cache)
+        for root, dirs, files in os.walk(base_dir):
+            if 'run_info.pck' in files:
+                self.rescan_runs(root)
+
+        return n_sess
+
+    def rescan_runs(self, data_dir):
+        try:
+            info = pickle.load(open(f'{data_dir}/run_info.pck', 'rb'))
+        except (pickle.UnpicklingError, EOFError):
+            return
+
+        for key, record in info.items():
+            if key.startswith('record_'):
+                self.add_run(data_dir, record)
+
+    def get_status(self, data_dir):
+        #Timing report is written at close_up
+        if os.path.exists(f'{data_dir}/timing.json'):
+            return 'done'
+        #Metadata is written at end of first run
+        if len(glob.glob(f'{data_dir}/*coords*.h5')) > 0 or \
+            os.path.exists(f'{data_dir}/{semp.Propagator.single_file}'):
+            return 'partial'
+        return 'incomplete'
+
+    def get_file_info(self, data_dir):
+        #Field files and time extension
+        info = {'files':sorted([os.path.basename(f) for f in glob.glob(f'{data_dir}/*.h5')])}
+        if os.path.exists(f'{data_dir}/time_ext.npy'):
+            info['time_ext'] = float(np.load(f'{data_dir}/time_ext.npy'))
+
+        #Stored with single output file
+        single = f'{data_dir}/{semp.Propagator.single_file}'
+        if os.path.exists(single):
+            with h5py.File(single, 'r') as f:
+                if 'time_ext' in f.attrs:
+                    info['time_ext'] = float(f.attrs['time_ext'])
+
+        #Total run time
+        if os.path.exists(f'{data_dir}/timing.json'):
+            with open(f'{data_dir}/timing.json', 'r') as f:
+                info['run_time'] = json.load(f).get('total_time')
+
+        return info
+
+############################################
+############################################
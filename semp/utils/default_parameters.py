@@ -28,6 +28,7 @@ def_params_MEEP = {
     ### Lab Properties  ###
     'polars':           ['s','p'],  # Polarization. Options:'s'-skipping, 'p'-plunging
     'wave':             0.5,        # Central wavelength.
+    'waves':            None,       # List of wavelengths for broadband run (overrides wave)
     'is_diverging':     False,      # Diverging light source
     'source_distance':  27.5,       # Units: [m], Light source distance for diverging beam
     'source_offset_y':  0,          # Units: [m], Light source center in y
@@ -70,8 +71,15 @@ def_params_MEEP = {
     'padz':             6.,         # 3D padding between PML and start of gap [um]
     'pml_all':          None,       # If not None, replaces all PML components with value
     'pad_all':          None,       # If not None, replaces all pad components with value
-    'n_periods':        50,         # Number of optical time periods to run
+    'n_periods':        50,         # Number of optical time periods to run (maximum if steady_tol)
+    'steady_tol':       None,       # If not None, stop when period-to-period change is below tol
+    'dft_periods':      None,       # If not None, save DFT phasor over final periods (non-PML only)
+    'cw_tol':           1e-8,       # Tolerance of frequency-domain solver
+    'cw_maxiters':      10000,      # Maximum iterations of frequency-domain solver
+    'cw_L':             10,         # BiCGSTAB-L order of frequency-domain solver
     'courant':          0.5,        # Courant number (lower is slower, but more numerically stable)
+    'split_chunks_evenly':  False,  # Split cell into equal chunks (False balances by cost)
+    'chunk_layout':     None,       # Options: [None (meep's split), 'cost' (balance SEMP cost map)]
 }
 
 ##############################################
@@ -88,11 +96,31 @@ def_params_PROP = {
     'save_nt':          1,          # Number of saves per optical time period
     'is_movie':         False,      # Run movie?
 
+    ### Solver ###
+    'engine':           'time_domain',  # Options: [time_domain, frequency_domain]
+
     ### Saving ###
     'base_dir':         semp.results_dir,       # Directory base
     'session':          '',         # Session: save under 'base_dir/session'
     'verbose':          True,       # Print statements?
     'save_all':         True,
+    'output_region':    None,       # Options: [None/'full', 'nonpml', list of obs. distances, list of (center, size)]
+    'output_format':    'files',    # Options: ['files' (one per output, as meep), 'single' (one per directory)]
+    'compression':      None,       # Lossless compression of 'single' format. Options: [None, 'gzip', 'lzf']
+    'progress_dt':      None,       # Optical periods between progress reports (None turns off)
+    'use_catalog':      False,      # Record session in results catalog ('results_dir/catalog.db')
+    'use_vac_cache':    False,      # Reuse vacuum runs from cache in 'int_data_dir/vac_cache'
+    'reuse_existing':   False,      # Link identical finished runs found in results catalog
+    'analytic_vac':     False,      # Skip vacuum run and normalize by analytic field
+    'use_structure_cache':  False,  # Reuse initialized structure from 'int_data_dir/structure_cache'
+
+    ### Checkpointing ###
+    'checkpoint_dt':    None,       # Optical periods between checkpoints (None turns off; CW time domain only)
+    'resume':           False,      # Resume from latest checkpoint and skip finished runs
+
+    ### Performance ###
+    'reuse_sim':        False,      # Keep structure between polarizations (if no mirror symmetry)
+    'joint_polarization':   False,  # Run s and p in single 2D simulation (if no mirror symmetry)
 }
 
 ##############################################
@@ -112,8 +140,49 @@ def_params_ANLZ = {
     'base_dir':         semp.results_dir,       # Directory base
     'session':          '',         # Session: load from 'base_dir/session'
     'time_ext':         None,
+    'analytic_vac':     None,       # Normalize by analytic vacuum. If None, use run setting
     ### Analyzing ###
     'obs_distance':     0.,         # Distance from wafer bottom to near field.
+    'output_volume':    0,          # Index of volume loaded (if output_region is list of volumes)
+}
+
+##############################################
+##############################################
+
+############################################
+####	SWEEP Parameters ####
+############################################
+
+#Default parameters for Sweep
+def_params_SWEEP = {
+    ### Saving ###
+    'base_dir':         semp.results_dir,       # Directory base
+    'session':          'sweep',    # Sweep saved under 'base_dir/session/job_name'
+    ### Execution ###
+    'n_cores':          None,       # Total cores to use. If None, use all
+    'n_procs':          1,          # MPI processes per job
+    'mpirun':           'mpirun',   # MPI launcher. If None, run with python directly
+    'max_retries':      1,          # Number of times to retry a failed job
+    'rerun_done':       False,      # Rerun jobs marked done in existing manifest?
+    'job_cmd':          None,       # Command template to run '{job_file}'. If None, run SEMP job
+    ### Queue ###
+    'heartbeat_dt':     30,         # Seconds between heartbeats on claimed job
+    'stale_time':       300,        # Seconds without heartbeat before claim is reclaimed
+    'poll_dt':          10,         # Seconds between checks for claimable jobs
+}
+
+##############################################
+##############################################
+
+############################################
+####	ENSEMBLE Parameters ####
+############################################
+
+#Default parameters for Ensemble
+def_params_ENSEMBLE = {
+    'waves':            None,       # Wavelengths to run [microns]. If None, use MEEP 'wave'
+    'polars':           None,       # Polarizations to run. If None, use MEEP 'polars'
+    'n_groups':         None,       # Number of process groups. If None, one per run (up to mpi_size)
 }
 
 ##############################################
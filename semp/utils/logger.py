@@ -17,6 +17,12 @@ import time
 from datetime import datetime
 import h5py
 import pickle
+import json
+import os
+import sys
+import resource
+import sqlite3
+from contextlib import contextmanager
 
 class Logger(object):
 
@@ -33,9 +39,18 @@ class Logger(object):
     def initialize(self):
         self.data_dir = f"{self.prop.base_dir}/{self.prop.session}"
 
+        #Timing spans
+        self.spans = []
+        self.open_spans = []
+        self.span_run = ''
+        self.span_zero = time.perf_counter()
+
+        #Grid points owned by this rank in each run
+        self.chunk_points = {}
+
     def start_up(self):
         #Create save directory
-        if semp.zero_rank and not self.prop.is_analysis:
+        if semp.group_zero_rank and not self.prop.is_analysis:
             self.util.create_directory(self.data_dir)
         #Start
         self.start_time = time.perf_counter()
@@ -45,6 +60,9 @@ class Logger(object):
     def close_up(self):
         #Finish
         self.end_time = time.perf_counter()
+        self.save_timing_report()
+        self.save_rank_report()
+        self.update_catalog('done')
         self.print_finishing_message()
 
 ############################################
@@ -59,6 +77,127 @@ class Logger(object):
             data_dir = self.data_dir
         return f"{data_dir}/{base_name}.{file_type}"
 
+    def get_wave_dir(self, wave, data_dir=None):
+        #Subdirectory for single wavelength of broadband run
+        if data_dir is None:
+            data_dir = self.data_dir
+        return f"{data_dir}/{wave*1e3:.0f}nm"
+
+############################################
+############################################
+
+############################################
+#####  Timing Spans #####
+############################################
+
+    @contextmanager
+    def span(self, name):
+        #Open span (nested spans are subtracted from parent's self time)
+        span = {'name':name, 'run':self.span_run, \
+            'start':time.perf_counter() - self.span_zero, 'child_time':0.}
+        self.open_spans.append(span)
+        try:
+            yield span
+        finally:
+            #Close span
+            span['duration'] = time.perf_counter() - self.span_zero - span['start']
+            span['self_time'] = span['duration'] - span.pop('child_time')
+            span['peak_rss'] = self.get_peak_rss()
+            self.open_spans.pop()
+            if len(self.open_spans) > 0:
+                self.open_spans[-1]['child_time'] += span['duration']
+            self.spans.append(span)
+
+    def timed(self, name, func):
+        #Wrap function (e.g., meep step function) in span
+        def timed_func(*args, **kwargs):
+            with self.span(name):
+                return func(*args, **kwargs)
+        return timed_func
+
+    def save_timing_report(self):
+        #Gather spans of all ranks
+        all_spans = semp.group_gather(self.spans)
+
+        #Return immediately if not zero-rank processor
+        if not semp.group_zero_rank:
+            return
+
+        #Summary of each span (self time, summed over runs) across ranks
+        names = list(dict.fromkeys([sp['name'] for spans in all_spans for sp in spans]))
+        summary = {}
+        for name in names:
+            tots = np.array([sum([sp['self_time'] for sp in spans if sp['name'] == name]) \
+                for spans in all_spans])
+            summary[name] = {'mean':tots.mean(), 'min':tots.min(), 'max':tots.max(), \
+                'per_rank':tots.tolist()}
+
+        #Save
+        report = {'n_ranks':len(all_spans), 'total_time':self.end_time - self.start_time, \
+            'summary':summary, 'spans':all_spans}
+        with open(self.filename('timing', 'json'), 'w') as f:
+            json.dump(report, f, indent=2)
+
+        #Print
+        for name, summ in summary.items():
+            self.write(f'{name}: {summ["mean"]:.2f} [s] (max {summ["max"]:.2f} [s])', \
+                is_time=False)
+
+############################################
+############################################
+
+############################################
+#####  Resources #####
+############################################
+
+    def get_peak_rss(self):
+        #Peak resident memory of this process [bytes] (kB on linux)
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss * [1024, 1][int(sys.platform == 'darwin')]
+
+    def record_chunks(self, sim):
+        #Grid points in chunks owned by this rank (meep's rank within group)
+        vols = sim.structure.get_chunk_volumes()
+        owners = sim.structure.get_chunk_owners()
+        self.chunk_points[self.span_run] = int(sum([vol.ntot() for vol, own in \
+            zip(vols, owners) if own == semp.group_rank]))
+
+    def save_rank_report(self):
+        #Peak memory after each phase, chunk points and stepping time of this rank
+        phases = list(dict.fromkeys([sp['name'] for sp in self.spans]))
+        info = {'rank':semp.group_rank, 'chunk_points':max(self.chunk_points.values(), \
+            default=0), 'step_time':sum([sp['self_time'] for sp in self.spans \
+            if sp['name'] == 'stepping']), 'peak_rss':{ph: max([sp['peak_rss'] for sp in \
+            self.spans if sp['name'] == ph]) for ph in phases}}
+
+        #Gather to zero rank
+        all_info = semp.group_gather(info)
+
+        #Return immediately if not zero-rank processor
+        if not semp.group_zero_rank:
+            return
+
+        #Imbalance (max / mean) of points and stepping time
+        pts = np.array([inf['chunk_points'] for inf in all_info])
+        stp = np.array([inf['step_time'] for inf in all_info])
+        imb_pts = pts.max() / max(pts.mean(), 1)
+        imb_stp = stp.max() / max(stp.mean(), 1e-12)
+
+        #Build table (memory in MB)
+        hdr = f'{"rank":>5s} {"points":>12s} {"step[s]":>10s} ' + \
+            ' '.join([f'{ph[:12]+"[MB]":>16s}' for ph in phases])
+        rows = [f'{inf["rank"]:5d} {inf["chunk_points"]:12d} {inf["step_time"]:10.2f} ' + \
+            ' '.join([f'{inf["peak_rss"].get(ph, 0)/1e6:16.1f}' for ph in phases]) \
+            for inf in all_info]
+        ftr = f'Imbalance (max/mean): points {imb_pts:.2f}, stepping {imb_stp:.2f}'
+
+        #Save
+        with open(self.filename('rank_report', 'txt'), 'w') as f:
+            f.write('\n'.join([hdr] + rows + ['', ftr]) + '\n')
+
+        #Print
+        self.write(ftr, is_time=False)
+
 ############################################
 ############################################
 
@@ -68,7 +207,7 @@ class Logger(object):
 
     def write(self, txt='',is_brk=False,n_strs=2,is_time=True,is_err=False,is_skip=True):
         #Return immediately if not zero rank
-        if not semp.zero_rank:
+        if not semp.group_zero_rank:
             return
 
         #Build message
@@ -116,7 +255,7 @@ class Logger(object):
 
     def save_parameters(self):
         #Return immediately if not zero-rank processor
-        if not semp.zero_rank:
+        if not semp.group_zero_rank:
             return
 
         #Save user parameters
@@ -124,6 +263,92 @@ class Logger(object):
         #Save default parameters
         pickle.dump(semp.utils.def_params, open(self.filename('def_params', 'pck'), 'wb'))
 
+        #Save single wavelength parameters into each broadband directory
+        if self.prop.msim.is_broadband:
+            for wave in self.prop.msim.waves:
+                #Replace wavelengths
+                params = self.util.deepcopy(self.prop.params)
+                params['MEEP_params']['wave'] = wave
+                params['MEEP_params']['waves'] = None
+
+                #Create directory
+                wave_dir = self.util.create_directory(self.get_wave_dir(wave))
+
+                #Save parameters
+                pickle.dump(params, open(self.filename('parameters', 'pck', \
+                    data_dir=wave_dir), 'wb'))
+                pickle.dump(semp.utils.def_params, open(self.filename('def_params', \
+                    'pck', data_dir=wave_dir), 'wb'))
+
+        #Add to results catalog
+        self.update_catalog('running')
+
+    def update_catalog(self, status):
+        #Return immediately if not zero-rank processor or not saving
+        if not semp.group_zero_rank or self.prop.is_analysis or not self.prop.use_catalog:
+            return
+
+        try:
+            catalog = semp.utils.Catalog()
+
+            #New entry at start of run
+            if status == 'running':
+                catalog.add_session(self.data_dir, self.prop.params, status=status)
+
+            #Finished: store run time and output files
+            else:
+                info = catalog.get_file_info(self.data_dir)
+                info['run_time'] = self.end_time - self.start_time
+                catalog.update_session(self.data_dir, status=status, **info)
+
+        #Don't stop simulation if catalog is unavailable (e.g., locked)
+        except sqlite3.Error as err:
+            bad_str = self.util.color_string('!*!', self.util.bad_color)
+            print(f'\n{bad_str} Could not update catalog: {err} {bad_str}\n')
+
+    def save_run_info(self, key, value, data_dir=None):
+        #Return immediately if not zero-rank processor
+        if not semp.group_zero_rank:
+            return
+
+        #Load existing info
+        fname = self.filename('run_info', 'pck', data_dir=data_dir)
+        if os.path.exists(fname):
+            info = pickle.load(open(fname, 'rb'))
+        else:
+            info = {}
+
+        #Add and save
+        info[key] = value
+        pickle.dump(info, open(fname, 'wb'))
+
+    def save_progress(self, progress, data_dir=None):
+        #Return immediately if not zero-rank processor
+        if not semp.group_zero_rank:
+            return
+
+        #Write to temporary file then replace (may be polled while writing)
+        fname = self.filename('progress', 'json', data_dir=data_dir)
+        with open(f'{fname}.tmp', 'w') as f:
+            json.dump(progress, f)
+        os.replace(f'{fname}.tmp', fname)
+
+    def save_vac_dirs(self, vac_dirs):
+        #Return immediately if not zero-rank processor
+        if not semp.group_zero_rank:
+            return
+
+        #Save pointers to (cached) vacuum directories
+        pickle.dump(vac_dirs, open(self.filename('vac_dirs', 'pck'), 'wb'))
+
+        #Save into each broadband directory
+        if self.prop.msim.is_broadband:
+            for wave in self.prop.msim.waves:
+                wave_dirs = {k: self.get_wave_dir(wave, data_dir=v) \
+                    for k, v in vac_dirs.items()}
+                pickle.dump(wave_dirs, open(self.filename('vac_dirs', 'pck', \
+                    data_dir=self.get_wave_dir(wave)), 'wb'))
+
 ############################################
 ############################################
 
@@ -131,6 +356,16 @@ class Logger(object):
 #####   Loading functions #####
 ############################################
 
+    def load_run_info(self, data_dir=None):
+        #Load info (decided by zero rank)
+        info = {}
+        if semp.group_zero_rank:
+            fname = self.filename('run_info', 'pck', data_dir=data_dir)
+            if os.path.exists(fname):
+                info = pickle.load(open(fname, 'rb'))
+
+        return semp.group_bcast(info)
+
     def load_parameters(self, alz=None):
         #Load from analyzer
         if alz is not None:
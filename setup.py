@@ -16,6 +16,7 @@ setup(
     url='https://github.com/harnessa/semp',
     license='',
     package_data={},
+    entry_points={'console_scripts': ['semp=semp.job_queue:main']},
     requires=['numpy', 'scipy', 'h5py', 'matplotlib', 'mpi4py', 'pytest'],
     )
 
@@ -0,0 +1,65 @@
+"""
+test_analytic_vac.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Test analytic vacuum field against a short simulated vacuum run at
+    the same resolution.
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import numpy as np
+import meep as mp
+import semp
+
+class Test_Analytic_Vac(object):
+
+    ### HARDWIRED ###
+    meep_params = {
+        'sim_geometry':     'edge',
+        'wave':             0.641,
+        'resolution':       20,
+        'n_periods':        30,
+    }
+    tol = 2e-2
+
+############################################
+####	Tests ####
+############################################
+
+    def test_all(self):
+        prop = semp.Propagator(self.meep_params, {'verbose':False}, is_analysis=True)
+        msim = prop.msim
+
+        for pol, comp in zip(['s', 'p'], ['ez', 'hz']):
+
+            #Simulated vacuum at end of run (magnetic fields synchronized, as when saved)
+            sim = msim.build_sim(pol=pol, is_vac=True)
+            vol = msim.get_nonpml_volume(True)
+            out = {}
+            def get_field(sim):
+                out['fld'] = sim.get_array(vol=vol, component=getattr(mp, comp.capitalize()))
+            sim.run(mp.at_end(mp.synchronized_magnetic(get_field)), until=msim.run_time)
+            xx = np.atleast_1d(sim.get_array_metadata(vol=vol)[0])
+            fld = out['fld']
+
+            #Analytic at same points and time
+            vac = msim.get_analytic_vacuum(comp, xx, sim.meep_time())
+            sim.reset_meep()
+
+            #Compare on observation side of source (wave traveling in +x)
+            obs = xx >= msim.geo.wafer_thick/2
+            assert(obs.sum() > 0 and msim.geo.source_x < msim.geo.wafer_thick/2)
+            err = np.abs(fld[obs] - vac[obs]).max() / np.abs(vac[obs]).max()
+            assert(err < self.tol)
+
+############################################
+############################################
+
+if __name__ == '__main__':
+
+    tst = Test_Analytic_Vac()
+    tst.test_all()
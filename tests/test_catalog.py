@@ -0,0 +1,136 @@
+"""
+test_catalog.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Test SEMP results catalog by rescanning fake session directories
+    and querying them by parameter value.
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import semp
+import os
+import json
+import pickle
+import tempfile
+
+class Test_Catalog(object):
+
+    ### HARDWIRED ###
+    waves = [0.641, 0.725]
+    angles = [0, 5]
+
+############################################
+####	Tests ####
+############################################
+
+    def run_all_tests(self):
+        for tt in ['query', 'update', 'runs', 'rescan']:
+            getattr(self, f'test_{tt}')()
+
+    def test_query(self):
+        with tempfile.TemporaryDirectory() as base_dir:
+            catalog = self.make_catalog(base_dir)
+
+            #All sessions found
+            assert(len(catalog.query()) == len(self.waves)*len(self.angles))
+
+            #Numeric match
+            rows = catalog.query(wave=0.641, taper_angle=5)
+            assert(len(rows) == 1)
+            assert(rows[0]['session'] == 'w0.641_a5')
+            assert(rows[0]['base_dir'] == base_dir)
+
+            #Text match and status
+            assert(len(catalog.query(sim_geometry='edge')) == len(self.angles)*len(self.waves))
+            assert(len(catalog.query(sim_geometry='gap')) == 0)
+            assert(len(catalog.query(status='done')) == len(self.angles))
+
+            #Identical parameters give identical hash
+            hashes = set([row['param_hash'] for row in catalog.query()])
+            assert(len(hashes) == len(self.waves)*len(self.angles))
+
+    def test_update(self):
+        with tempfile.TemporaryDirectory() as base_dir:
+            catalog = self.make_catalog(base_dir)
+
+            #Mark running session finished
+            data_dir = f'{base_dir}/w0.725_a0'
+            catalog.update_session(data_dir, status='done', run_time=10., files=['ez-1.h5'])
+            row = catalog.query(wave=0.725, taper_angle=0)[0]
+            assert(row['status'] == 'done' and row['run_time'] == 10.)
+
+            #Rescan restores state on disk
+            catalog.rescan(base_dir)
+            assert(catalog.query(wave=0.725, taper_angle=0)[0]['status'] == 'incomplete')
+
+    def test_runs(self):
+        with tempfile.TemporaryDirectory() as base_dir:
+            catalog = self.make_catalog(base_dir)
+
+            #Record of run saved with session
+            data_dir = f'{base_dir}/w0.641_a0'
+            record = {'run_key':'abc', 'done_key':'done_s', 'files':['ez-1.h5'], \
+                'info':{'done_s':True}}
+            pickle.dump({'done_s':True, 'record_s':record}, \
+                open(f'{data_dir}/run_info.pck', 'wb'))
+
+            #Found after rescan
+            catalog.rescan(base_dir)
+            runs = catalog.find_runs('abc')
+            assert(len(runs) == 1 and runs[0][0] == data_dir and runs[0][1] == record)
+            assert(len(catalog.find_runs('xyz')) == 0)
+
+    def test_rescan(self):
+        with tempfile.TemporaryDirectory() as base_dir:
+            catalog = self.make_catalog(base_dir)
+            n_all = len(catalog.query())
+
+            #Only clears given directory, not others sharing its prefix ('_' is literal)
+            catalog.rescan(f'{base_dir}/w0.641_a')
+            assert(len(catalog.query()) == n_all)
+            catalog.rescan(f'{base_dir}/w0.641_a0')
+            assert(len(catalog.query()) == n_all)
+
+            #Location stored where session was written
+            row = catalog.query(wave=0.641, taper_angle=0)[0]
+            assert(row['base_dir'] == base_dir and row['session'] == 'w0.641_a0')
+
+############################################
+############################################
+
+############################################
+####	Helpers ####
+############################################
+
+    def make_catalog(self, base_dir):
+        #Session directories with saved parameters
+        for wave in self.waves:
+            for angle in self.angles:
+                data_dir = f'{base_dir}/w{wave}_a{angle}'
+                os.makedirs(data_dir)
+                params = {'MEEP_params':{'wave':wave, 'taper_angle':angle, \
+                    'sim_geometry':'edge'}, 'PROP_params':{}}
+                pickle.dump(params, open(f'{data_dir}/parameters.pck', 'wb'))
+
+                #Finished sessions have timing report
+                if wave == self.waves[0]:
+                    with open(f'{data_dir}/timing.json', 'w') as f:
+                        json.dump({'total_time':1.}, f)
+
+        #Build catalog
+        catalog = semp.utils.Catalog(f'{base_dir}/catalog.db')
+        catalog.rescan(base_dir)
+
+        return catalog
+
+############################################
+############################################
+
+if __name__ == '__main__':
+
+    tst = Test_Catalog()
+    tst.run_all_tests()
@@ -0,0 +1,98 @@
+"""
+test_estimator.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Test SEMP preflight estimate against the run logic of each mode
+    (CW, DFT phasor, broadband) and boundary layer type.
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import numpy as np
+import meep as mp
+import semp
+
+class Test_Estimator(object):
+
+    ### HARDWIRED ###
+    base_params = {
+        'sim_geometry':     'edge',
+        'wave':             0.641,
+        'resolution':       20,
+        'n_periods':        20,
+    }
+
+############################################
+####	Tests ####
+############################################
+
+    def run_all_tests(self):
+        for tt in ['phasor', 'broadband', 'absorber']:
+            getattr(self, f'test_{tt}')()
+
+    def test_phasor(self):
+        #DFT is accumulated within run time, so same steps as CW
+        cw = self.get_estimate()
+        phs = self.get_estimate(dft_periods=5)
+        assert(phs['n_steps'] == cw['n_steps'])
+        assert(cw['n_steps'] == self.get_expected_steps(self.get_msim()))
+
+    def test_broadband(self):
+        #Runs until run time after pulse has passed
+        pms = {'waves':[0.641, 0.725]}
+        msim = self.get_msim(**pms)
+        src = mp.GaussianSource(msim.fcen, fwidth=msim.fwidth)
+        sim_time = msim.run_time + src.start_time + 2*src.cutoff*src.width
+        assert(self.get_estimate(**pms)['n_steps'] == self.get_expected_steps(msim, sim_time))
+
+    def test_absorber(self):
+        #Absorber has no PML auxiliary fields
+        pml = self.get_estimate(use_absorber=False)
+        absb = self.get_estimate(use_absorber=True)
+        assert(absb['n_field_arrays'] < pml['n_field_arrays'])
+
+        #Difference is PML auxiliary fields in y (less absorber conductivity, if added)
+        msim = self.get_msim(use_absorber=True)
+        n_comps = 3
+        x_frac = 2*msim.pmlx / msim.geo.lx
+        y_frac = 2*msim.pmly / msim.geo.ly
+        all_frac = 1. - (1. - x_frac)*(1. - y_frac)
+        aux = 2.*n_comps*(all_frac - x_frac)
+        diff = pml['n_field_arrays'] - absb['n_field_arrays']
+        assert(aux - 0.5*n_comps*y_frac - 1e-9 <= diff <= aux + 1e-9)
+
+############################################
+############################################
+
+############################################
+####	Helpers ####
+############################################
+
+    def get_params(self, **kwargs):
+        pms = semp.utils.util.deepcopy(self.base_params)
+        pms.update(kwargs)
+        return pms
+
+    def get_msim(self, **kwargs):
+        prop = semp.Propagator(self.get_params(**kwargs), {'verbose':False}, is_analysis=True)
+        return prop.msim
+
+    def get_estimate(self, **kwargs):
+        return semp.estimate(self.get_params(**kwargs), {'verbose':False}, nprocs=1, \
+            verbose=False)
+
+    def get_expected_steps(self, msim, sim_time=None):
+        if sim_time is None:
+            sim_time = msim.run_time
+        return int(np.ceil(sim_time / (msim.courant / msim.resolution)))
+
+############################################
+############################################
+
+if __name__ == '__main__':
+
+    tst = Test_Estimator()
+    tst.run_all_tests()
@@ -0,0 +1,140 @@
+"""
+test_job_queue.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Test SEMP job queue by running several workers on one machine and
+    checking that each job is run exactly once.
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import semp
+import os
+import sys
+import time
+import json
+import tempfile
+import subprocess
+
+class Test_Job_Queue(object):
+
+    ### HARDWIRED ###
+    n_jobs = 12
+    n_workers = 4
+
+############################################
+####	Tests ####
+############################################
+
+    def run_all_tests(self):
+        for tt in ['run_once', 'stale_claim', 'lock_owner']:
+            getattr(self, f'test_{tt}')()
+
+    def test_run_once(self):
+        with tempfile.TemporaryDirectory() as base_dir:
+            sweep_dir = self.make_jobs(base_dir)
+
+            #Launch workers as separate processes
+            workers = [subprocess.Popen(self.get_worker_cmd(sweep_dir), \
+                stdout=subprocess.DEVNULL) for i in range(self.n_workers)]
+            for wrk in workers:
+                assert(wrk.wait() == 0)
+
+            #Check each job ran exactly once
+            for i in range(self.n_jobs):
+                with open(f'{sweep_dir}/jobs/job_{i}.pck', 'r') as f:
+                    assert(f.read().count('ran') == 1)
+                assert(os.path.exists(f'{sweep_dir}/done/job_{i}'))
+
+            #No claims left behind
+            assert(len(os.listdir(f'{sweep_dir}/claims')) == 0)
+
+    def test_stale_claim(self):
+        with tempfile.TemporaryDirectory() as base_dir:
+            self.make_jobs(base_dir)
+
+            #Build queue
+            queue = semp.job_queue.Job_Queue({'base_dir':base_dir, 'session':'queue', \
+                'stale_time':1, 'job_cmd':self.get_job_cmd()})
+            queue.util.create_directory(queue.claims_dir)
+
+            #Live claim is respected
+            assert(queue.claim_job('job_0'))
+            assert(not queue.claim_job('job_0'))
+            assert(queue.get_status('job_0') == 'claimed')
+
+            #Dead worker's claim is reclaimed
+            old = time.time() - 10
+            os.utime(queue.get_lock_file('job_0'), (old, old))
+            assert(queue.get_status('job_0') == 'pending')
+            assert(queue.claim_job('job_0'))
+
+    def test_lock_owner(self):
+        with tempfile.TemporaryDirectory() as base_dir:
+            self.make_jobs(base_dir)
+
+            #Build queue and claim job
+            queue = semp.job_queue.Job_Queue({'base_dir':base_dir, 'session':'queue', \
+                'job_cmd':self.get_job_cmd()})
+            queue.util.create_directory(queue.claims_dir)
+            lock = queue.get_lock_file('job_0')
+            assert(queue.claim_job('job_0') and queue.is_owner(lock))
+
+            #Claim reclaimed by other worker is not released
+            with open(lock, 'w') as f:
+                json.dump({'worker':'other', 'time':time.time()}, f)
+            queue.release_own_lock(lock)
+            assert(os.path.exists(lock))
+
+            #Result of job whose claim was lost is dropped
+            queue.run_job('job_0')
+            assert(not os.path.exists(f'{queue.done_dir}/job_0'))
+            assert(os.path.exists(lock))
+
+            #Own claim is released
+            with open(lock, 'w') as f:
+                json.dump({'worker':queue.worker_id, 'time':time.time()}, f)
+            queue.release_own_lock(lock)
+            assert(not os.path.exists(lock))
+
+############################################
+############################################
+
+############################################
+####	Helpers ####
+############################################
+
+    def make_jobs(self, base_dir):
+        #Job files (dummy jobs append to their own file)
+        sweep_dir = f'{base_dir}/queue'
+        os.makedirs(f'{sweep_dir}/jobs')
+        for i in range(self.n_jobs):
+            open(f'{sweep_dir}/jobs/job_{i}.pck', 'w').close()
+
+        #Manifest with costs
+        with open(f'{sweep_dir}/manifest.json', 'w') as f:
+            json.dump({f'job_{i}':{'cost':i} for i in range(self.n_jobs)}, f)
+
+        return sweep_dir
+
+    def get_job_cmd(self):
+        return [sys.executable, '-c', \
+            "import sys, time; time.sleep(0.2); open(sys.argv[1], 'a').write('ran\\n')", \
+            '{job_file}']
+
+    def get_worker_cmd(self, sweep_dir):
+        pms = {'base_dir':os.path.dirname(sweep_dir), 'session':'queue', \
+            'job_cmd':self.get_job_cmd(), 'poll_dt':0.1}
+        return [sys.executable, '-c', \
+            f'import semp; semp.job_queue.Job_Queue({pms!r}).work()']
+
+############################################
+############################################
+
+if __name__ == '__main__':
+
+    tst = Test_Job_Queue()
+    tst.run_all_tests()
@@ -0,0 +1,128 @@
+"""
+test_output_format.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Test Analyzer reads back the same fields from the legacy layout
+    (separate real/imaginary files), from the single output file, and from
+    explicit output volumes.
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import numpy as np
+import tempfile
+import pickle
+import h5py
+import semp
+
+class Test_Output_Format(object):
+
+    ### HARDWIRED ###
+    resolution = 20
+    comp = 'ez'
+    row = 3
+    volume = ((0, 0, 0), (1, 1, 0))
+
+############################################
+####	Tests ####
+############################################
+
+    def run_all_tests(self):
+        for tt in ['files', 'single', 'volumes']:
+            getattr(self, f'test_{tt}')()
+
+    def test_files(self):
+        self.check_format('files')
+
+    def test_single(self):
+        self.check_format('single')
+
+    def test_volumes(self):
+        #Second volume, given as (center, size) in parameters
+        for output_format in ['files', 'single']:
+            self.check_format(output_format, output_region=[self.volume]*2, \
+                output_volume=1)
+
+    def check_format(self, output_format, output_region='full', output_volume=0):
+        #Volume outputs have index in name
+        ext = ['', f'_vol{output_volume}'][int(output_region != 'full')]
+
+        with tempfile.TemporaryDirectory() as base_dir:
+            flds = self.write_run(base_dir, output_format, output_region, ext)
+            alz = semp.analysis.Analyzer({'base_dir':base_dir, 'session':'test', \
+                'output_volume':output_volume})
+
+            for is_vac in [False, True]:
+                #Expected field without PML
+                fld = flds[['', 'vac-'][int(is_vac)]]
+                fld = fld[alz.pnum_x:fld.shape[0]-alz.pnum_x]
+                if is_vac:
+                    fld = fld[:,None]
+                else:
+                    fld = fld[:,alz.pnum_y:fld.shape[1]-alz.pnum_y]
+
+                #Full field and single row
+                assert(np.allclose(alz.load_field(self.comp, is_vac=is_vac), fld))
+                assert(np.allclose(alz.load_field(self.comp, is_vac=is_vac, \
+                    ind=self.row), fld[self.row]))
+
+############################################
+############################################
+
+############################################
+####	Helpers ####
+############################################
+
+    def write_run(self, base_dir, output_format, output_region, ext):
+        data_dir = semp.utils.util.create_directory(f'{base_dir}/test')
+
+        #Parameters
+        meep_params = {'sim_geometry':'edge', 'resolution':self.resolution, 'wave':0.641}
+        prop_params = {'verbose':False, 'output_region':output_region, \
+            'output_format':output_format, 'analytic_vac':False}
+        pickle.dump({'MEEP_params':meep_params, 'PROP_params':prop_params}, \
+            open(f'{data_dir}/parameters.pck', 'wb'))
+        pickle.dump(semp.utils.def_params, open(f'{data_dir}/def_params.pck', 'wb'))
+
+        #Coordinates of full cell
+        prop = semp.Propagator(meep_params, prop_params, is_analysis=True)
+        geo = prop.msim.geo
+        xx = np.linspace(-geo.lx/2, geo.lx/2, int(geo.lx*self.resolution) + 1)
+        yy = np.linspace(-geo.ly/2, geo.ly/2, int(geo.ly*self.resolution) + 1)
+        zz = np.array([0.])
+        run_time = prop.msim.run_time
+
+        #Random fields
+        rng = np.random.default_rng(0)
+        flds = {}
+        for pre, shape in zip(['vac-', ''], [(xx.size,), (xx.size, yy.size)]):
+            fld = rng.random(shape) + 1j*rng.random(shape)
+            flds[pre] = fld
+
+            #Single file
+            if output_format == 'single':
+                prop.write_single(data_dir, f'{pre}eps{ext}', np.ones(shape), \
+                    {'xx':xx, 'yy':yy, 'zz':zz, 'time':run_time})
+                prop.write_single(data_dir, f'{pre}{self.comp}{ext}', fld, {'time':run_time})
+                continue
+
+            #Separate files
+            with h5py.File(f'{data_dir}/{pre}coords{ext}-{run_time:09.2f}.h5', 'w') as f:
+                for c, v in zip(['xx', 'yy', 'zz'], [xx, yy, zz]):
+                    f.create_dataset(c, data=v)
+            with h5py.File(f'{data_dir}/{pre}{self.comp}{ext}-{run_time:09.2f}.h5', 'w') as f:
+                f.create_dataset(f'{self.comp}.r', data=fld.real)
+                f.create_dataset(f'{self.comp}.i', data=fld.imag)
+
+        return flds
+
+############################################
+############################################
+
+if __name__ == '__main__':
+
+    tst = Test_Output_Format()
+    tst.run_all_tests()
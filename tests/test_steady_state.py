@@ -0,0 +1,61 @@
+"""
+test_steady_state.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Test steady state criterion on a pure CW field sampled at a
+    non-integer number of timesteps per period.
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import numpy as np
+import semp
+
+class Test_Steady_State(object):
+
+    ### HARDWIRED ###
+    wave = 0.641
+    resolution = 30
+    courant = 0.5
+    steady_tol = 1e-3
+    n_checks = 10
+
+############################################
+####	Tests ####
+############################################
+
+    def test_all(self):
+        prop = semp.Propagator({'wave':self.wave, 'resolution':self.resolution, \
+            'courant':self.courant, 'steady_tol':self.steady_tol}, \
+            {'verbose':False}, is_analysis=True)
+
+        #Period is not a multiple of timestep
+        dt = self.courant / self.resolution
+        assert(abs(self.wave/dt - round(self.wave/dt)) > 0.1)
+
+        #Checks happen at first step at or after each period
+        times = np.ceil(np.arange(1, self.n_checks + 1)*self.wave/dt) * dt
+
+        #Pure CW field along observation line
+        amp = np.exp(1j*np.linspace(0, 3, 50))
+        flds = [amp*np.exp(-1j*2.*np.pi*prop.msim.fcen*tt) for tt in times]
+
+        #Raw snapshots differ in phase
+        assert(prop.get_steady_error(flds[1], flds[0]) > self.steady_tol)
+
+        #Demodulated fields satisfy criterion
+        for i in range(1, len(times)):
+            err = prop.get_steady_error(prop.demodulate(flds[i], times[i]), \
+                prop.demodulate(flds[i-1], times[i-1]))
+            assert(err < self.steady_tol)
+
+############################################
+############################################
+
+if __name__ == '__main__':
+
+    tst = Test_Steady_State()
+    tst.test_all()
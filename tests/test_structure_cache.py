@@ -0,0 +1,74 @@
+"""
+test_structure_cache.py
+
+Author: Anthony Harness
+Affiliation: Princeton University
+Created on: 10-17-2026
+Package: SEMP
+
+Description: Test SEMP structure cache by initializing a structure once, then
+    loading it from the cache into a new simulation.
+License: Refer to $pkg_home_dir/LICENSE
+"""
+
+import numpy as np
+import meep as mp
+import tempfile
+import semp
+import os
+
+class Test_Structure_Cache(object):
+
+    ### HARDWIRED ###
+    meep_params = {
+        'sim_geometry':     'edge',
+        'wave':             0.641,
+        'resolution':       10,
+    }
+
+############################################
+####	Tests ####
+############################################
+
+    def test_all(self):
+        old_dir = semp.structure_cache_dir
+        with tempfile.TemporaryDirectory() as cache_dir:
+            semp.structure_cache_dir = cache_dir
+            prop = semp.Propagator(self.meep_params, {'verbose':False, \
+                'use_structure_cache':True}, is_analysis=True)
+            key_dir = f'{cache_dir}/{prop.msim.get_structure_key()}'
+
+            #First run initializes and writes cache
+            eps0 = self.get_eps(prop)
+            assert(os.path.exists(f'{key_dir}/structure.h5'))
+            assert(len(os.listdir(cache_dir)) == 1)
+
+            #Second run loads same structure from cache
+            eps1 = self.get_eps(prop)
+            assert(np.allclose(eps0, eps1))
+            assert(len(os.listdir(cache_dir)) == 1)
+
+        semp.structure_cache_dir = old_dir
+
+############################################
+############################################
+
+############################################
+####	Helpers ####
+############################################
+
+    def get_eps(self, prop):
+        sim = prop.msim.build_sim(pol='s', is_vac=False)
+        prop.load_structure_cache(sim, False)
+        assert(sim.structure is not None)
+        eps = sim.get_array(component=mp.Dielectric)
+        sim.reset_meep()
+        return eps
+
+############################################
+############################################
+
+if __name__ == '__main__':
+
+    tst = Test_Structure_Cache()
+    tst.test_all()